@@ -1,14 +1,20 @@
 """FastAPI application for Vinted scraper management."""
 import asyncio
+import base64
+import math
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
 from pathlib import Path
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from sqlalchemy import select, func, and_
+from fastapi.responses import FileResponse, ORJSONResponse
+from sqlalchemy import Integer, bindparam, select, func, and_, case, inspect, text, tuple_, type_coerce
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import (
@@ -20,10 +26,10 @@ from app.db.models import (
     ConditionOption,
     SourceOption,
 )
+from app.config import settings
 from app.utils.conditions import normalize_condition
 from app.db.session import Session, init_db
 from app.api.schemas import (
-    ListingResponse,
     ListingDetail,
     ListingListResponse,
     PriceHistoryResponse,
@@ -37,13 +43,24 @@ from app.utils.categories import list_common_categories, list_video_game_platfor
 from app.ingest import scrape_and_store
 from app.utils.url import build_catalog_url
 from app.scheduler import sync_crontab, list_scheduled_jobs
+from fastAPI.redis import get_redis, query_cache_key
 
 app = FastAPI(
     title="Vinted Scraper API",
     description="API for managing Vinted product scraping and price tracking",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+# Distinct currencies change rarely; keep them for a minute per filter set.
+CURRENCY_CACHE_TTL = 60
+# Filtered totals only feed the pager; a minute of staleness is acceptable.
+TOTAL_CACHE_TTL = 60
+# Taxonomy tables are seeded at startup and change rarely.
+LOOKUP_CACHE_TTL = 300
+# Dashboard stats are polled; absorb the polling with a short-lived copy.
+STATS_CACHE_TTL = 30
+
 # Get frontend path
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 FRONTEND_DIR = BASE_DIR / "frontend"
@@ -65,10 +82,114 @@ async def get_db():
         yield session
 
 
+async def _execute_isolated(stmt):
+    """Execute a read-only statement on its own pooled session."""
+    async with Session() as session:
+        return await session.execute(stmt)
+
+
+async def _cached_json(cache_key: str, ttl: int, load):
+    """Return ``await load()``, cached as JSON in Redis for ``ttl`` seconds."""
+    redis = get_redis()
+    if redis is not None:
+        try:
+            cached = await redis.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception:  # Redis is optional; fall back to the database
+            redis = None
+
+    value = await load()
+
+    if redis is not None:
+        try:
+            await redis.set(cache_key, orjson.dumps(value), ex=ttl)
+        except Exception:
+            pass
+    return value
+
+
+async def _load_available_currencies(
+    cache_key: str, currency_stmt, fallback_stmt=None
+) -> list[str]:
+    """Return distinct currencies for a filter set, cached briefly in Redis.
+
+    ``fallback_stmt`` is used when ``currency_stmt`` fails, e.g. when the
+    listing_currencies view has not been created yet.
+    """
+    async def load() -> list[str]:
+        try:
+            currency_rows = await _execute_isolated(currency_stmt)
+        except DBAPIError:
+            if fallback_stmt is None:
+                raise
+            currency_rows = await _execute_isolated(fallback_stmt)
+        return sorted({row[0] for row in currency_rows if row[0]})
+
+    return await _cached_json(cache_key, CURRENCY_CACHE_TTL, load)
+
+
+async def _load_total(cache_key: str, count_stmt) -> int:
+    """Return the row count for a filter set, cached briefly in Redis."""
+    async def load() -> int:
+        return int((await _execute_isolated(count_stmt)).scalar() or 0)
+
+    return await _cached_json(cache_key, TOTAL_CACHE_TTL, load)
+
+
+_LOOKUP_STMTS = {
+    "categories": select(CategoryOption.id, CategoryOption.name),
+    "platforms": select(PlatformOption.id, PlatformOption.name),
+    "conditions": select(ConditionOption.id, ConditionOption.code, ConditionOption.label),
+    "sources": select(SourceOption.id, SourceOption.code, SourceOption.label),
+}
+
+
+def _name_lookup(rows) -> dict:
+    return {row[0]: row[1] for row in rows}
+
+
+def _option_lookups(rows) -> dict:
+    return {
+        "by_id": {row[0]: {"code": row[1], "label": row[2]} for row in rows},
+        "by_code": {row[1]: row[0] for row in rows},
+        "by_label": {row[2].lower(): row[0] for row in rows},
+    }
+
+
+# Maps derived from each taxonomy table, built once per cache refresh rather
+# than on every request.
+_LOOKUP_BUILDERS = {
+    "categories": _name_lookup,
+    "platforms": _name_lookup,
+    "conditions": _option_lookups,
+    "sources": _option_lookups,
+}
+_lookup_cache: dict[str, tuple[float, list, dict]] = {}
+_lookup_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _load_lookup(name: str) -> tuple[list, dict]:
+    """Return rows of a taxonomy table and their lookup maps, cached in-process for LOOKUP_CACHE_TTL."""
+    cached = _lookup_cache.get(name)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1], cached[2]
+
+    async with _lookup_locks[name]:
+        cached = _lookup_cache.get(name)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1], cached[2]
+        rows = (await _execute_isolated(_LOOKUP_STMTS[name])).all()
+        maps = _LOOKUP_BUILDERS[name](rows)
+        _lookup_cache[name] = (time.monotonic() + LOOKUP_CACHE_TTL, rows, maps)
+        return rows, maps
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize database on startup."""
     await init_db()
+    await asyncio.gather(*(_load_lookup(name) for name in _LOOKUP_STMTS))
 
 
 # ==================== Listings Endpoints ====================
@@ -84,6 +205,136 @@ SORTABLE_LISTING_FIELDS = {
     "platform_ids": Listing.platform_ids,
 }
 
+# ORDER BY clauses for every (sort field, direction) pair, built once. The id
+# tiebreaker keeps pages stable across ties and matches the (column, id)
+# sort indexes.
+_ORDER_CLAUSES = {
+    (field, direction): (
+        (column.desc().nullslast(), Listing.id.desc())
+        if direction == "desc"
+        else (column.asc().nullsfirst(), Listing.id.asc())
+    )
+    for field, column in SORTABLE_LISTING_FIELDS.items()
+    for direction in ("asc", "desc")
+}
+_KEYSET_ORDER = (Listing.last_seen_at.desc().nullslast(), Listing.id.desc())
+
+
+_IS_POSTGRES = settings.database_url.startswith("postgresql")
+
+# Materialized view of (currency, is_active) pairs; see migration 013.
+_CURRENCY_VIEW_STMT = text(
+    f'SELECT DISTINCT currency FROM "{settings.schema}".listing_currencies '
+    "WHERE is_active OR NOT :active_only"
+)
+
+_LISTING_COLS = tuple(attr.key for attr in inspect(Listing).column_attrs)
+
+# Columns backing ListingResponse; the list view selects only these instead
+# of hydrating full Listing objects.
+LISTING_LIST_COLUMNS = (
+    Listing.id,
+    Listing.vinted_id,
+    Listing.url,
+    Listing.title,
+    Listing.price_cents,
+    Listing.currency,
+    Listing.brand,
+    Listing.condition,
+    Listing.location,
+    Listing.seller_name,
+    Listing.photo,
+    Listing.description,
+    Listing.language,
+    Listing.source,
+    Listing.category_id,
+    Listing.platform_ids,
+    Listing.details_scraped,
+    Listing.first_seen_at,
+    Listing.last_seen_at,
+    Listing.is_active,
+    Listing.is_visible,
+    Listing.is_sold,
+    Listing.condition_option_id,
+    Listing.source_option_id,
+)
+
+
+def _encode_cursor(last_seen_at: datetime, listing_id: int) -> str:
+    """Pack a keyset position into an opaque, URL-safe token."""
+    raw = f"{last_seen_at.isoformat()}|{listing_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(token: str) -> tuple[datetime, int]:
+    """Unpack a token produced by _encode_cursor."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        timestamp, _, listing_id = base64.urlsafe_b64decode(padded).decode().partition("|")
+        return datetime.fromisoformat(timestamp), int(listing_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _recent_price(listing_id, position: int):
+    """Correlated lookup of a listing's price ``position`` entries back in history."""
+    return (
+        select(PriceHistory.price_cents)
+        .where(PriceHistory.listing_id == listing_id)
+        .order_by(PriceHistory.observed_at.desc())
+        .offset(position)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def _priced_page(query, page_order):
+    """Wrap a page query with its two most recent prices and price_change.
+
+    The correlated lookups run against the already-limited page rows, so
+    price history costs no extra round trip, and price_change is derived in
+    SQL so the per-row Python loop only has to resolve taxonomy labels.
+    """
+    page = (
+        query.add_columns(func.row_number().over(order_by=page_order).label("position"))
+        .order_by(*page_order)
+        .subquery("page")
+    )
+    priced = select(
+        page,
+        _recent_price(page.c.id, 0).label("latest_price_cents"),
+        _recent_price(page.c.id, 1).label("previous_price_cents"),
+    ).subquery("priced")
+    latest, previous = priced.c.latest_price_cents, priced.c.previous_price_cents
+    return select(
+        *(c for c in priced.c if c.key not in ("position", "latest_price_cents")),
+        case(
+            (latest > previous, "up"),
+            (latest < previous, "down"),
+            (latest == previous, "same"),
+            else_=None,
+        ).label("price_change"),
+    ).order_by(priced.c.position)
+
+
+def _unfiltered_page_stmt(sort_key: str, sort_direction: str, active_only: bool):
+    query = select(*LISTING_LIST_COLUMNS)
+    if active_only:
+        query = query.where(Listing.is_active.is_(True))
+    query = query.offset(bindparam("page_offset", type_=Integer)).limit(
+        bindparam("page_limit", type_=Integer)
+    )
+    return _priced_page(query, _ORDER_CLAUSES[sort_key, sort_direction])
+
+
+# Page statements for requests with no filter besides active_only, built once
+# so the common listing request skips rebuilding the expression tree.
+_UNFILTERED_PAGE_STMTS = {
+    (field, direction, active_only): _unfiltered_page_stmt(field, direction, active_only)
+    for field, direction in _ORDER_CLAUSES
+    for active_only in (False, True)
+}
+
 
 @app.get("/api/listings", response_model=ListingListResponse)
 async def get_listings(
@@ -102,9 +353,28 @@ async def get_listings(
     platform_id: Optional[int] = Query(None, ge=1),
     source_id: Optional[int] = Query(None, ge=1),
     source: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    cursor_last_seen_at: Optional[datetime] = Query(None),
+    cursor_id: Optional[int] = Query(None, ge=1),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get list of listings with pagination, search, sorting, and currency filters."""
+    """Get list of listings with pagination, search, sorting, and currency filters.
+
+    Passing ``cursor`` (the previous page's ``next_cursor.token``) or the
+    explicit ``cursor_last_seen_at``/``cursor_id`` pair switches to keyset
+    pagination, which stays fast at any depth; ``page`` is then only echoed
+    back. ``include_total=false`` skips the filtered COUNT entirely and
+    returns ``total``/``total_pages`` as null.
+    """
+    if cursor is not None:
+        if cursor_last_seen_at is not None or cursor_id is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="Pass either cursor or cursor_last_seen_at/cursor_id, not both",
+            )
+        cursor_last_seen_at, cursor_id = _decode_cursor(cursor)
+
     offset = (page - 1) * page_size
 
     if (
@@ -142,10 +412,11 @@ async def get_listings(
     if category_id is not None:
         filters.append(Listing.category_id == category_id)
     if platform_id is not None:
-        if Listing.__table__.columns.platform_ids.type.__class__.__module__.startswith(
-            "sqlalchemy.dialects.postgresql"
-        ):
-            filters.append(Listing.platform_ids.cast(postgresql.JSONB).contains([platform_id]))
+        if _IS_POSTGRES:
+            # platform_ids is JSONB on PostgreSQL; @> is served by its GIN index.
+            filters.append(
+                Listing.platform_ids.op("@>")(type_coerce([platform_id], postgresql.JSONB))
+            )
         else:
             filters.append(Listing.platform_ids.contains([platform_id]))
     if source_id is not None:
@@ -163,65 +434,109 @@ async def get_listings(
     if sort_direction not in {"asc", "desc"}:
         raise HTTPException(status_code=400, detail="Invalid sort order")
 
-    order_column = SORTABLE_LISTING_FIELDS[sort_key]
-    if sort_direction == "desc":
-        order_clause = order_column.desc().nullslast()
-    else:
-        order_clause = order_column.asc().nullsfirst()
-
-    base_query = select(Listing)
-    if filters:
-        base_query = base_query.where(*filters)
-
-    query = base_query.order_by(order_clause).offset(offset).limit(page_size)
+    keyset_sort = sort_key == "last_seen_at" and sort_direction == "desc"
+    use_cursor = cursor_last_seen_at is not None or cursor_id is not None
+    if use_cursor:
+        if cursor_last_seen_at is None or cursor_id is None:
+            raise HTTPException(
+                status_code=400,
+                detail="cursor_last_seen_at and cursor_id must be provided together",
+            )
+        if not keyset_sort:
+            raise HTTPException(
+                status_code=400,
+                detail="Cursor pagination requires sort_field=last_seen_at and sort_order=desc",
+            )
 
-    result = await db.execute(query)
-    listings = result.scalars().all()
 
-    count_stmt = select(func.count()).select_from(Listing)
-    if filters:
-        count_stmt = count_stmt.where(*filters)
-    total = (await db.execute(count_stmt)).scalar() or 0
-
-    category_records = (
-        await db.execute(select(CategoryOption.id, CategoryOption.name))
-    ).all()
-    category_lookup = {row[0]: row[1] for row in category_records}
-
-    platform_records = (
-        await db.execute(select(PlatformOption.id, PlatformOption.name))
-    ).all()
-    platform_lookup = {row[0]: row[1] for row in platform_records}
-
-    condition_records = (
-        await db.execute(
-            select(ConditionOption.id, ConditionOption.code, ConditionOption.label)
+    # Pages fetch one extra row to learn has_next, so no COUNT is needed to
+    # page through results.
+    page_params = {}
+    if use_cursor:
+        # Keyset page: seek past the cursor on (last_seen_at, id) instead of
+        # scanning and discarding OFFSET rows.
+        query = _priced_page(
+            select(*LISTING_LIST_COLUMNS)
+            .where(
+                *filters,
+                tuple_(Listing.last_seen_at, Listing.id)
+                < tuple_(cursor_last_seen_at, cursor_id),
+            )
+            .limit(page_size + 1),
+            _KEYSET_ORDER,
         )
-    ).all()
-    condition_lookup = {
-        row[0]: {"code": row[1], "label": row[2]}
-        for row in condition_records
-    }
-    condition_code_lookup = {row[1]: row[0] for row in condition_records}
-    condition_label_lookup = {row[2].lower(): row[0] for row in condition_records}
-
-    source_records = (
-        await db.execute(
-            select(SourceOption.id, SourceOption.code, SourceOption.label)
+    elif len(filters) == int(active_only):
+        # Common case: reuse the prebuilt statement for this sort.
+        query = _UNFILTERED_PAGE_STMTS[sort_key, sort_direction, active_only]
+        page_params = {"page_offset": offset, "page_limit": page_size + 1}
+    else:
+        query = _priced_page(
+            select(*LISTING_LIST_COLUMNS)
+            .where(*filters)
+            .offset(offset)
+            .limit(page_size + 1),
+            _ORDER_CLAUSES[sort_key, sort_direction],
         )
-    ).all()
-    source_lookup = {
-        row[0]: {"code": row[1], "label": row[2]}
-        for row in source_records
-    }
-    source_code_lookup = {row[1]: row[0] for row in source_records}
-    source_label_lookup = {row[2].lower(): row[0] for row in source_records}
 
     currency_stmt = select(Listing.currency).distinct()
     if filters:
         currency_stmt = currency_stmt.where(*filters)
-    currency_rows = await db.execute(currency_stmt.order_by(Listing.currency.asc()))
-    available_currencies = sorted({row[0] for row in currency_rows if row[0]})
+    currency_stmt = currency_stmt.order_by(Listing.currency.asc())
+
+    # Without filters beyond active_only, read the precomputed
+    # listing_currencies view instead of a DISTINCT over the whole table.
+    currency_fallback_stmt = None
+    if _IS_POSTGRES and len(filters) == int(active_only):
+        currency_fallback_stmt = currency_stmt
+        currency_stmt = _CURRENCY_VIEW_STMT.bindparams(active_only=active_only)
+
+    filter_params = {
+        "active_only": active_only,
+        "search": search,
+        "currency": currency,
+        "price_min": price_min,
+        "price_max": price_max,
+        "condition_id": condition_id,
+        "condition": condition,
+        "category_id": category_id,
+        "platform_id": platform_id,
+        "source_id": source_id,
+        "source": source,
+    }
+    currency_cache_key = query_cache_key("listings:currencies:v1", filter_params)
+
+    # The page, currency and taxonomy queries are independent; run them on
+    # separate pooled connections so their round trips overlap.
+    pending = [
+        db.execute(query, page_params),
+        _load_available_currencies(currency_cache_key, currency_stmt, currency_fallback_stmt),
+        *(_load_lookup(name) for name in ("categories", "platforms", "conditions", "sources")),
+    ]
+    if include_total:
+        count_stmt = select(func.count()).select_from(Listing).where(*filters)
+        pending.append(
+            _load_total(query_cache_key("listings:total:v1", filter_params), count_stmt)
+        )
+    (
+        result,
+        available_currencies,
+        (_, category_lookup),
+        (_, platform_lookup),
+        (condition_records, condition_maps),
+        (source_records, source_maps),
+        *count_result,
+    ) = await asyncio.gather(*pending)
+    total = count_result[0] if include_total else None
+    listings = [dict(row) for row in result.mappings().all()]
+    has_next = len(listings) > page_size
+    del listings[page_size:]
+
+    condition_lookup = condition_maps["by_id"]
+    condition_code_lookup = condition_maps["by_code"]
+    condition_label_lookup = condition_maps["by_label"]
+    source_lookup = source_maps["by_id"]
+    source_code_lookup = source_maps["by_code"]
+    source_label_lookup = source_maps["by_label"]
 
     available_category_ids = sorted(category_lookup.keys())
     available_platform_ids = sorted(platform_lookup.keys())
@@ -229,30 +544,20 @@ async def get_listings(
     enriched = []
     active_condition_ids: set[int] = set()
     active_source_ids: set[int] = set()
-    for listing in listings:
-        price_result = await db.execute(
-            select(PriceHistory.price_cents)
-            .where(PriceHistory.listing_id == listing.id)
-            .order_by(PriceHistory.observed_at.desc())
-            .limit(2)
-        )
-        prices = price_result.scalars().all()
-
-        listing_dict = listing.__dict__.copy()
-        listing_dict['previous_price_cents'] = None
-        listing_dict['price_change'] = None
-        listing_dict['category_name'] = category_lookup.get(listing.category_id)
+    # Pages repeat a handful of raw condition strings; normalize each once.
+    resolved_conditions: dict[Optional[str], tuple] = {}
+    for listing_dict in listings:
+        listing_dict['category_name'] = category_lookup.get(listing_dict['category_id'])
 
         platform_names: list[str] = []
-        platform_ids_value = listing.platform_ids if isinstance(listing.platform_ids, list) else []
-        for platform in platform_ids_value:
+        for platform in listing_dict['platform_ids']:
             if isinstance(platform, int):
                 name = platform_lookup.get(platform)
                 if name:
                     platform_names.append(name)
         listing_dict['platform_names'] = platform_names or None
 
-        condition_option_id = listing.condition_option_id
+        condition_option_id = listing_dict['condition_option_id']
         condition_code = None
         condition_label = None
         if condition_option_id and condition_option_id in condition_lookup:
@@ -261,12 +566,18 @@ async def get_listings(
             condition_label = entry['label']
             active_condition_ids.add(condition_option_id)
         else:
-            norm_id, norm_code, norm_label = normalize_condition(listing.condition)
-            resolved_id = (
-                norm_id
-                or condition_code_lookup.get((norm_code or '').lower())
-                or condition_label_lookup.get((norm_label or '').strip().lower())
-            )
+            raw_condition = listing_dict['condition']
+            resolved = resolved_conditions.get(raw_condition)
+            if resolved is None:
+                norm_id, norm_code, norm_label = normalize_condition(raw_condition)
+                resolved = resolved_conditions[raw_condition] = (
+                    norm_id
+                    or condition_code_lookup.get((norm_code or '').lower())
+                    or condition_label_lookup.get((norm_label or '').strip().lower()),
+                    norm_code,
+                    norm_label,
+                )
+            resolved_id, norm_code, norm_label = resolved
             if resolved_id and resolved_id in condition_lookup:
                 entry = condition_lookup[resolved_id]
                 condition_option_id = resolved_id
@@ -277,7 +588,7 @@ async def get_listings(
                 condition_code = norm_code
                 condition_label = norm_label
 
-        source_option_id = listing.source_option_id
+        source_option_id = listing_dict['source_option_id']
         source_code = None
         source_label = None
         if source_option_id and source_option_id in source_lookup:
@@ -286,7 +597,7 @@ async def get_listings(
             source_label = entry['label']
             active_source_ids.add(source_option_id)
         else:
-            raw_source = (listing.source or '').strip().lower()
+            raw_source = (listing_dict['source'] or '').strip().lower()
             resolved_id = source_code_lookup.get(raw_source) or source_label_lookup.get(raw_source)
             if resolved_id and resolved_id in source_lookup:
                 entry = source_lookup[resolved_id]
@@ -296,7 +607,7 @@ async def get_listings(
                 active_source_ids.add(source_option_id)
             else:
                 source_code = raw_source or 'unknown'
-                source_label = listing.source or 'Unknown'
+                source_label = listing_dict['source'] or 'Unknown'
 
         listing_dict['condition_option_id'] = condition_option_id
         listing_dict['condition_code'] = condition_code
@@ -305,42 +616,47 @@ async def get_listings(
         listing_dict['source'] = source_code
         listing_dict['source_label'] = source_label
 
-        if len(prices) >= 2:
-            current, previous = prices[0], prices[1]
-            listing_dict['previous_price_cents'] = previous
-
-            if current is not None and previous is not None:
-                if current > previous:
-                    listing_dict['price_change'] = 'up'
-                elif current < previous:
-                    listing_dict['price_change'] = 'down'
-                else:
-                    listing_dict['price_change'] = 'same'
-
-        enriched.append(ListingResponse(**listing_dict))
-
-    has_next = offset + len(enriched) < total
-
-    return ListingListResponse(
-        items=enriched,
-        total=int(total),
-        page=page,
-        page_size=page_size,
-        has_next=has_next,
-        available_currencies=available_currencies,
-        available_conditions=[
-            ConditionResponse(id=row[0], code=row[1], label=row[2])
+        enriched.append(listing_dict)
+
+    next_cursor = None
+    if keyset_sort and has_next and enriched:
+        last = enriched[-1]
+        next_cursor = {
+            "last_seen_at": last["last_seen_at"],
+            "id": last["id"],
+            "token": _encode_cursor(last["last_seen_at"], last["id"]),
+        }
+
+    # The rows are already shaped like ListingResponse; hand plain dicts to
+    # orjson rather than building and re-validating a model per listing.
+    return ORJSONResponse({
+        "items": enriched,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": math.ceil(total / page_size) if total is not None else None,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
+        "available_currencies": available_currencies,
+        "available_conditions": [
+            {"id": row[0], "code": row[1], "label": row[2]}
             for row in condition_records
             if not active_condition_ids or row[0] in active_condition_ids
         ],
-        available_category_ids=available_category_ids,
-        available_platform_ids=sorted(available_platform_ids),
-        available_sources=[
-            SourceResponse(id=row[0], code=row[1], label=row[2])
+        "available_categories": [
+            {"id": category_id, "name": category_lookup[category_id]}
+            for category_id in available_category_ids
+        ],
+        "available_platforms": [
+            {"id": platform_id, "name": platform_lookup[platform_id]}
+            for platform_id in available_platform_ids
+        ],
+        "available_sources": [
+            {"id": row[0], "code": row[1], "label": row[2]}
             for row in source_records
             if not active_source_ids or row[0] in active_source_ids
         ],
-    )
+    })
 
 
 @app.get("/api/listings/{listing_id}", response_model=ListingDetail)
@@ -363,7 +679,7 @@ async def get_listing(listing_id: int, db: AsyncSession = Depends(get_db)):
     prices = price_result.scalars().all()
 
     return ListingDetail(
-        **listing.__dict__,
+        **{key: getattr(listing, key) for key in _LISTING_COLS},
         price_history=[
             PriceHistoryResponse.model_validate(p) for p in prices
         ]
@@ -575,47 +891,40 @@ async def get_platforms():
 @app.get("/api/stats", response_model=StatsResponse)
 async def get_stats(db: AsyncSession = Depends(get_db)):
     """Get dashboard statistics."""
-    # Total listings
-    result = await db.execute(select(func.count()).select_from(Listing))
-    total_listings = result.scalar()
+    return await _cached_json("stats:current", STATS_CACHE_TTL, _load_stats)
 
-    # Active listings
-    result = await db.execute(
-        select(func.count()).select_from(Listing).where(Listing.is_active == True)
-    )
-    active_listings = result.scalar()
 
-    # Today's scrapes
+async def _load_stats() -> dict:
     today = datetime.utcnow().date()
-    result = await db.execute(
-        select(func.count())
-        .select_from(Listing)
-        .where(func.date(Listing.first_seen_at) == today)
-    )
-    total_scraped_today = result.scalar()
-
-    # Active configs
-    result = await db.execute(
+    active_priced = and_(Listing.is_active == True, Listing.price_cents.isnot(None))
+
+    # All listing figures come from one scan with conditional aggregates;
+    # the config count runs alongside it on its own pooled session.
+    listing_stats_stmt = select(
+        func.count().label("total_listings"),
+        func.count().filter(Listing.is_active == True).label("active_listings"),
+        func.count().filter(func.date(Listing.first_seen_at) == today).label("total_scraped_today"),
+        func.avg(Listing.price_cents).filter(active_priced).label("avg_price_cents"),
+    ).select_from(Listing)
+    config_stats_stmt = (
         select(func.count())
         .select_from(ScrapeConfig)
         .where(ScrapeConfig.is_active == True)
     )
-    active_configs = result.scalar()
-
-    # Average price
-    result = await db.execute(
-        select(func.avg(Listing.price_cents))
-        .where(and_(Listing.is_active == True, Listing.price_cents.isnot(None)))
-    )
-    avg_price_cents = result.scalar()
-
-    return StatsResponse(
-        total_listings=total_listings,
-        active_listings=active_listings,
-        total_scraped_today=total_scraped_today,
-        active_configs=active_configs,
-        avg_price_cents=float(avg_price_cents) if avg_price_cents else None,
+    listing_result, config_result = await asyncio.gather(
+        _execute_isolated(listing_stats_stmt),
+        _execute_isolated(config_stats_stmt),
     )
+    listing_stats = listing_result.one()
+    avg_price_cents = listing_stats.avg_price_cents
+
+    return {
+        "total_listings": listing_stats.total_listings,
+        "active_listings": listing_stats.active_listings,
+        "total_scraped_today": listing_stats.total_scraped_today,
+        "active_configs": config_result.scalar(),
+        "avg_price_cents": float(avg_price_cents) if avg_price_cents else None,
+    }
 
 
 @app.get("/api/cron/jobs")
@@ -646,4 +955,4 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
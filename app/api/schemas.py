@@ -60,13 +60,21 @@ class ListingDetail(ListingResponse):
     price_history: list = Field(default_factory=list)
 
 
+class ListingCursor(BaseModel):
+    """Keyset position of the last listing on a page (last_seen_at, id)."""
+    last_seen_at: datetime
+    id: int
+    token: str  # Opaque form of (last_seen_at, id); pass back as ?cursor=
+
+
 class ListingListResponse(BaseModel):
     items: list[ListingResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
     has_next: bool
+    next_cursor: Optional[ListingCursor] = None
     available_currencies: list[str] = Field(default_factory=list)
     available_conditions: list["ConditionResponse"] = Field(default_factory=list)
     available_categories: list["CategoryResponse"] = Field(default_factory=list)
@@ -380,14 +388,6 @@ class StatsResponse(BaseModel):
     inactive_listings_today: int
     inactive_listings_last_7_days: int
     inactive_listings_last_30_days: int
-    active_listings_day_before_previous: int
-    total_scraped_last_7_days_day_before_previous: int
-    total_scraped_last_30_days_day_before_previous: int
-    active_listings_last_7_days_day_before_previous: int
-    active_listings_last_30_days_day_before_previous: int
-    inactive_listings_day_before_previous: int
-    inactive_listings_last_7_days_day_before_previous: int
-    inactive_listings_last_30_days_day_before_previous: int
     active_configs: int
     avg_price_cents: Optional[float] = None
     min_price_cents: Optional[int] = None
@@ -398,8 +398,8 @@ class StatsResponse(BaseModel):
     total_listings_previous_day: int
     total_listings_previous_7_days: int
     total_listings_previous_30_days: int
-    total_listings_day_before_previous: int
     total_scraped_previous_day: int
+    total_scraped_day_before_previous: int
     total_scraped_previous_7_days: int
     total_scraped_previous_30_days: int
     source_stats: dict[str, dict[str, int]] = Field(default_factory=dict)
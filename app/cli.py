@@ -802,7 +802,7 @@ def verify_status(
         2.0,
         "--delay",
         "-d",
-        help="Delay between requests in seconds (default: 2.0)"
+        help="Back-off in seconds after a failed check (default: 2.0)"
     ),
     check_all: bool = typer.Option(
         False,
@@ -822,7 +822,7 @@ def verify_status(
         vinted-scraper verify-status              # 100 items, 24h (default)
         vinted-scraper verify-status --all        # Check inactive items too
         vinted-scraper verify-status -b 50 -h 12  # 50 items, 12 hours
-        vinted-scraper verify-status -d 3.0       # Slower (avoid 403)
+        vinted-scraper verify-status -d 3.0       # Back off longer after 403s
 
     PERFORMANCE: ~2-3 sec/item | 100 items = ~5-8 min
     """
@@ -1,15 +1,30 @@
 from __future__ import annotations
 import os
 from dataclasses import dataclass, field
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 
-load_dotenv()
+_env_loaded = False
+
+def ensure_env_loaded() -> None:
+    """Load the project-level .env once per process."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    load_dotenv(find_dotenv())
+    _env_loaded = True
+
+ensure_env_loaded()
 
 def _as_bool(v: str | None, default: bool) -> bool:
     if v is None:
         return default
     return v.strip().lower() in ("1", "true", "yes", "y")
 
+def _as_list(v: str | None) -> list[str]:
+    if not v:
+        return []
+    return [item.strip() for item in v.split(",") if item.strip()]
+
 @dataclass(frozen=True)
 class Settings:
     database_url: str = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./vinted.db")
@@ -24,5 +39,13 @@ class Settings:
     fetch_details: bool = _as_bool(os.getenv("FETCH_DETAILS"), True)
     fastapi_api_key: str | None = os.getenv("FASTAPI_API_KEY")
     fastapi_api_key_header: str = os.getenv("FASTAPI_API_KEY_HEADER", "X-API-Key")
+    fastapi_cors_origins: list[str] = field(
+        default_factory=lambda: _as_list(os.getenv("FASTAPI_CORS_ORIGINS", "http://localhost:8934"))
+    )
+
+    @property
+    def fastapi_cors_allow_all(self) -> bool:
+        origins = self.fastapi_cors_origins
+        return "*" in origins or "*:*" in origins
 
 settings = Settings()
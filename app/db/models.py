@@ -5,6 +5,8 @@ from sqlalchemy import (
     String, Integer, BigInteger, DateTime, Boolean, JSON, Numeric, Index,
     ForeignKey, UniqueConstraint, func, false
 )
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from ..config import settings
 
@@ -13,6 +15,21 @@ class Base(DeclarativeBase):
     pass
 
 
+class PlatformIdList(TypeDecorator):
+    """JSON list of platform IDs (JSONB on PostgreSQL); always loads as a list."""
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+
+    def process_result_value(self, value, dialect):
+        return value if isinstance(value, list) else []
+
+
 class CategoryOption(Base):
     __tablename__ = "category_options"
 
@@ -102,7 +119,9 @@ class Listing(Base):
 
     # 🎮 Category and platform tracking
     category_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    platform_ids: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)  # Array of platform IDs
+    platform_ids: Mapped[list] = mapped_column(
+        PlatformIdList(), nullable=True
+    )  # Array of platform IDs
 
     # Bookkeeping
     first_seen_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=func.now())
@@ -150,6 +169,17 @@ class Listing(Base):
         Index("ix_listings_category_id", "category_id"),
         Index("ix_listings_details_scraped", "details_scraped"),
         Index("ix_listings_is_visible", "is_visible"),
+        Index("ix_listings_last_seen_at_id", "last_seen_at", "id"),
+        # DESC NULLS LAST as in migration 014; other dialects get plain columns.
+        Index(
+            "ix_listings_active_last_seen_at_id",
+            "is_active",
+            "last_seen_at",
+            "id",
+            postgresql_ops={"last_seen_at": "DESC NULLS LAST", "id": "DESC"},
+        ),
+        Index("ix_listings_condition_option_id", "condition_option_id"),
+        Index("ix_listings_source_option_id", "source_option_id"),
         {"schema": settings.schema} if settings.database_url.startswith("postgresql") else {}
     )
 
@@ -171,6 +201,12 @@ class PriceHistory(Base):
     listing: Mapped[Listing] = relationship(back_populates="prices")
 
     __table_args__ = (
+        Index(
+            "ix_price_history_listing_observed",
+            "listing_id",
+            "observed_at",
+            postgresql_include=["price_cents"],
+        ),
         {"schema": settings.schema} if settings.database_url.startswith("postgresql") else {},
     )
 
@@ -7,9 +7,10 @@ import requests
 from typing import Optional
 from app.scraper.browser import get_html_with_browser, init_driver
 from vinted_api_kit import VintedApi
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.db.models import Listing, PriceHistory, ConditionOption, SourceOption, CategoryOption, PlatformOption
+from app.config import settings
 from app.db.session import Session, init_db
 from app.scraper.parse_header import parse_catalog_page
 from app.scraper.parse_detail import parse_detail_html
@@ -295,6 +296,32 @@ async def mark_old_listings_inactive(session, logger, hours_threshold: int = 48)
     return result.rowcount
 
 
+# Materialized views read by the API; refreshed after each scrape.
+MATERIALIZED_VIEWS = ("listing_currencies", "listing_price_changes")
+
+
+async def refresh_materialized_views(session, logger):
+    """
+    Refresh the API's materialized views (PostgreSQL only).
+
+    The API reads available currencies (listing_currencies) and price change
+    counts (listing_price_changes) from these views; refreshing after each
+    scrape keeps them in step with newly stored listings and prices.
+    """
+    if not settings.database_url.startswith("postgresql"):
+        return
+
+    for view in MATERIALIZED_VIEWS:
+        try:
+            await session.execute(
+                text(f'REFRESH MATERIALIZED VIEW CONCURRENTLY "{settings.schema}".{view}')
+            )
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"Could not refresh {view} view: {e}")
+
+
 # -----------------------------------------------------
 # Main Scraper Logic
 # -----------------------------------------------------
@@ -616,6 +643,7 @@ async def _scrape_and_store_locale(
                 logger.info(f"Marked {inactive_count} listing(s) as inactive (not seen in 48+ hours)")
             else:
                 logger.info("All listings are up to date")
+            await refresh_materialized_views(session, logger)
 
     # Get final database stats
     async with Session() as session:
@@ -294,6 +294,9 @@ def build_scrape_command(
     return f"cd {_quote(cwd)} && {command_with_logging}"
 
 
+_sync_lock = asyncio.Lock()
+
+
 def get_user_crontab() -> CronTab:
     """Get the current user's crontab."""
     return CronTab(user=True)
@@ -303,7 +306,13 @@ async def sync_crontab() -> None:
     """
     Sync scrape configurations with system crontab.
     This function should be called whenever configs are created/updated/deleted.
+    Concurrent calls are serialized so the crontab is never rewritten in parallel.
     """
+    async with _sync_lock:
+        await _sync_crontab()
+
+
+async def _sync_crontab() -> None:
     await init_db()
     cron = get_user_crontab()
 
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+
+class _Slot:
+    """Handle yielded by AdaptiveLimiter.use(); mark `dropped` on failure."""
+
+    __slots__ = ("dropped",)
+
+    def __init__(self):
+        self.dropped = False
+
+
+class AdaptiveLimiter:
+    """
+    Vegas-style concurrency limiter.
+
+    Tracks the lowest observed latency as the "uncongested" baseline and
+    estimates how many requests are queueing at the server from each new
+    sample. The in-flight limit grows while the estimated queue stays below
+    `alpha`, shrinks when it exceeds `beta`, and is halved when a request
+    is marked as dropped (timeouts, 403/429 responses).
+    """
+
+    def __init__(self, initial_limit=2, min_limit=1, max_limit=16, alpha=2, beta=4):
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.alpha = alpha
+        self.beta = beta
+        self._in_flight = 0
+        self._min_rtt = None
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def use(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        slot = _Slot()
+        start = time.monotonic()
+        try:
+            yield slot
+        except BaseException:
+            slot.dropped = True
+            raise
+        finally:
+            rtt = time.monotonic() - start
+            async with self._cond:
+                self._in_flight -= 1
+                self._update(rtt, slot.dropped)
+                self._cond.notify_all()
+
+    def _update(self, rtt, dropped):
+        if dropped:
+            self.limit = max(self.min_limit, self.limit // 2)
+            return
+
+        if self._min_rtt is None or rtt < self._min_rtt:
+            self._min_rtt = rtt
+        if rtt <= 0:
+            return
+
+        queue = self.limit * (1 - self._min_rtt / rtt)
+        if queue < self.alpha:
+            self.limit = min(self.max_limit, self.limit + 1)
+        elif queue > self.beta:
+            self.limit = max(self.min_limit, self.limit - 1)
@@ -1,6 +1,8 @@
 import os
 import httpx
 import asyncio
+from dataclasses import dataclass
+from app.config import ensure_env_loaded
 from app.utils.retry import retry_with_backoff
 from app.utils.logging import get_logger
 
@@ -13,6 +15,73 @@ LLM_REQUEST_DELAY = 3.0
 LLM_PROVIDER_OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 LLM_PROVIDER_GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
 
+LLM_PROVIDER_URLS = {
+    "OPENROUTER": LLM_PROVIDER_OPENROUTER_URL,
+    "GROQ": LLM_PROVIDER_GROQ_URL,
+}
+
+# Static system prompt; kept identical across calls so providers can reuse the cached prefix
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful assistant that corrects, standardizes, and translates product titles into English. Correct typos and make titles consistent. For console games, remove platform names (e.g., 'PS4', 'PS5', 'Xbox', 'Xbox One', 'Xbox Series X', 'Nintendo Switch') to keep only the exact, full game title. DO NOT shorten or alter the core game title itself. Also, remove unnecessary regional indicators (e.g., 'PL', 'EU'), and simplify special edition names where appropriate. Always output the corrected and standardized title in English. Examples: 'Mafia The ols country' -> 'Mafia The Old Country', 'PS4 Gra Marvel’s Spider-Man PL' -> 'Marvel's Spider-Man', 'Ghost of Yotei' -> 'Ghost of Yötei', 'Xbox One Cyberpunk 2077 Day One Edition' -> 'Cyberpunk 2077', 'Nintendo Switch Zelda BOTW' -> 'The Legend of Zelda: Breath of the Wild', 'Syberia 3, edycja kolekcjonerska' -> 'Syberia 3 Collector's Edition', 'Battlefield 6 PS5' -> 'Battlefield 2042', 'Assassin's Creed: Syndicate PS4 and PS5' -> 'Assassin's Creed: Syndicate'. Only return the corrected title, nothing else."}
+
+# Earlier LLM corrections, keyed by the original title. A title that is
+# either a known original or an output the LLM already produced needs no
+# round trip: scrapes see the same listings over and over.
+TITLE_CORRECTION_CACHE_SIZE = 4096
+_corrections: dict[str, str] = {}
+_canonical_titles: set[str] = set()
+
+
+def _cached_correction(title: str) -> str | None:
+    if title in _corrections:
+        return _corrections[title]
+    if title in _canonical_titles:
+        return title
+    return None
+
+
+def _remember_correction(original_title: str, corrected_title: str) -> None:
+    if len(_corrections) >= TITLE_CORRECTION_CACHE_SIZE:
+        # Dicts keep insertion order; drop the oldest entry.
+        evicted = _corrections.pop(next(iter(_corrections)))
+        _canonical_titles.discard(evicted)
+    _corrections[original_title] = corrected_title
+    _canonical_titles.add(corrected_title)
+
+
+@dataclass(frozen=True)
+class LLMConfig:
+    """LLM provider settings resolved once from the environment."""
+    provider: str | None
+    url: str | None
+    key: str | None
+    model: str | None
+    skip_reason: str | None = None
+
+
+def _load_llm_config() -> LLMConfig:
+    ensure_env_loaded()
+    provider = os.getenv("PROVIDER")
+    api_key = os.getenv("LLM_API_KEY")
+    model = os.getenv("LLM_MODEL")
+
+    logger.debug(f"LLM Config: PROVIDER={provider}, LLM_MODEL={model}, API_KEY_SET={bool(api_key)}")
+
+    if not provider:
+        reason = "PROVIDER environment variable not set."
+    elif not api_key:
+        reason = f"LLM_API_KEY not set for provider {provider}."
+    elif not model:
+        reason = f"LLM_MODEL not set for provider {provider}."
+    elif provider.upper() not in LLM_PROVIDER_URLS:
+        reason = f"Unsupported LLM provider: {provider}."
+    else:
+        return LLMConfig(provider, LLM_PROVIDER_URLS[provider.upper()], api_key, model)
+    return LLMConfig(provider, None, api_key, model, skip_reason=reason)
+
+
+_LLM_CONFIG = _load_llm_config()
+
+
 @retry_with_backoff(retries=5, initial_delay=LLM_REQUEST_DELAY, backoff_factor=2)
 async def _call_llm_api(provider_url: str, api_key: str, model: str, prompt_messages: list) -> str:
     async with httpx.AsyncClient() as client:
@@ -47,38 +116,26 @@ async def correct_title_with_llm(original_title: str) -> str:
     Corrects and standardizes a product title using an LLM from the configured provider.
     Requires PROVIDER, LLM_API_KEY, and LLM_MODEL environment variables to be set.
     """
-    provider = os.getenv("PROVIDER")
-    api_key = os.getenv("LLM_API_KEY")
-    model = os.getenv("LLM_MODEL")
-
-    logger.debug(f"LLM Config: PROVIDER={provider}, LLM_MODEL={model}, API_KEY_SET={bool(api_key)}")
+    cached = _cached_correction(original_title)
+    if cached is not None:
+        logger.debug(f"Title corrected before, skipping LLM: {original_title}")
+        return cached
 
-    if not provider:
-        logger.warning("PROVIDER environment variable not set. Skipping LLM title correction.")
-        return original_title
-    if not api_key:
-        logger.warning(f"LLM_API_KEY not set for provider {provider}. Skipping LLM title correction.")
-        return original_title
-    if not model:
-        logger.warning(f"LLM_MODEL not set for provider {provider}. Skipping LLM title correction.")
+    config = _LLM_CONFIG
+    if config.url is None:
+        logger.warning(f"{config.skip_reason} Skipping LLM title correction.")
         return original_title
 
-    provider_url = None
-    if provider.upper() == "OPENROUTER":
-        provider_url = LLM_PROVIDER_OPENROUTER_URL
-    elif provider.upper() == "GROQ":
-        provider_url = LLM_PROVIDER_GROQ_URL
-    else:
-        logger.warning(f"Unsupported LLM provider: {provider}. Skipping LLM title correction.")
-        return original_title
+    provider = config.provider
 
     prompt_messages = [
-        {"role": "system", "content": "You are a helpful assistant that corrects, standardizes, and translates product titles into English. Correct typos and make titles consistent. For console games, remove platform names (e.g., 'PS4', 'PS5', 'Xbox', 'Xbox One', 'Xbox Series X', 'Nintendo Switch') to keep only the exact, full game title. DO NOT shorten or alter the core game title itself. Also, remove unnecessary regional indicators (e.g., 'PL', 'EU'), and simplify special edition names where appropriate. Always output the corrected and standardized title in English. Examples: 'Mafia The ols country' -> 'Mafia The Old Country', 'PS4 Gra Marvel’s Spider-Man PL' -> 'Marvel's Spider-Man', 'Ghost of Yotei' -> 'Ghost of Yötei', 'Xbox One Cyberpunk 2077 Day One Edition' -> 'Cyberpunk 2077', 'Nintendo Switch Zelda BOTW' -> 'The Legend of Zelda: Breath of the Wild', 'Syberia 3, edycja kolekcjonerska' -> 'Syberia 3 Collector's Edition', 'Battlefield 6 PS5' -> 'Battlefield 2042', 'Assassin's Creed: Syndicate PS4 and PS5' -> 'Assassin's Creed: Syndicate'. Only return the corrected title, nothing else."},
+        _SYSTEM_MSG,
         {"role": "user", "content": f"Correct and standardize this title: {original_title}"}
     ]
 
     try:
-        corrected_title = await _call_llm_api(provider_url, api_key, model, prompt_messages)
+        corrected_title = await _call_llm_api(config.url, config.key, config.model, prompt_messages)
+        _remember_correction(original_title, corrected_title)
         await asyncio.sleep(LLM_REQUEST_DELAY) # Enforce rate limit
         return corrected_title
 
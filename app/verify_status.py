@@ -15,6 +15,7 @@ import requests
 
 from app.db.models import Listing
 from app.db.session import Session, init_db
+from app.utils.adaptive import AdaptiveLimiter
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -28,6 +29,10 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# Small politeness jitter before each request; pacing is otherwise left to
+# the adaptive limiter.
+REQUEST_JITTER = 0.2
+
 
 async def check_item_status(url: str) -> Optional[dict]:
     """
@@ -96,7 +101,7 @@ async def verify_tracked_items(
     Args:
         batch_size: Number of items to check
         hours_since_last_seen: Check items not seen in this many hours
-        delay: Delay between requests (seconds)
+        delay: Back-off after a failed check (seconds); concurrency is tuned adaptively
         check_all: If True, check all items (active and inactive). If False, only check active items.
     """
     if not logger:
@@ -140,7 +145,20 @@ async def verify_tracked_items(
             "errors": 0,
         }
 
-        for idx, item in enumerate(items, 1):
+        limiter = AdaptiveLimiter()
+
+        async def _check(item):
+            await asyncio.sleep(random.uniform(0, REQUEST_JITTER))
+            async with limiter.use() as slot:
+                status = await check_item_status(item.url)
+                if status is None:
+                    slot.dropped = True
+                    await asyncio.sleep(delay)
+            return item, status
+
+        pending = [_check(item) for item in items]
+        for idx, next_done in enumerate(asyncio.as_completed(pending), 1):
+            item, status = await next_done
             try:
                 # Calculate ETA
                 if idx > 1:
@@ -149,12 +167,9 @@ async def verify_tracked_items(
                     remaining = total - idx + 1
                     eta_seconds = avg_time * remaining
                     eta_str = f"{int(eta_seconds // 60)}m {int(eta_seconds % 60)}s"
-                    logger.info(f"[{idx}/{total}] Checking {item.title[:50]}... (~{eta_str} remaining)")
+                    logger.info(f"[{idx}/{total}] Checked {item.title[:50]}... (~{eta_str} remaining, concurrency {limiter.limit})")
                 else:
-                    logger.info(f"[{idx}/{total}] Checking {item.title[:50]}...")
-
-                # Check status
-                status = await check_item_status(item.url)
+                    logger.info(f"[{idx}/{total}] Checked {item.title[:50]}...")
 
                 if status is None:
                     stats["errors"] += 1
@@ -181,9 +196,6 @@ async def verify_tracked_items(
                     stats["still_available"] += 1
                     logger.info(f"  🟢 Still available")
 
-                # Rate limiting
-                await asyncio.sleep(delay + random.uniform(0, 0.5))
-
             except Exception as e:
                 stats["errors"] += 1
                 logger.error(f"  ❌ Error: {e}")
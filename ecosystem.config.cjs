@@ -40,7 +40,7 @@ module.exports = {
       name: "vinted-fastapi",
       cwd: "/home/datament/project/vinted",
       script: "/home/datament/project/vinted/.venv/bin/uvicorn",
-      args: "fastAPI.main:app --host 0.0.0.0 --port 8933",
+      args: "fastAPI.main:app --host 0.0.0.0 --port 8933 --loop uvloop --http httptools",
       interpreter: "/home/datament/project/vinted/.venv/bin/python",
       env: {
         FASTAPI_HOST: process.env.FASTAPI_HOST || "0.0.0.0",
@@ -2,18 +2,24 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from typing import Any, Callable
 
 import sentry_sdk
-from dotenv import load_dotenv, find_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 
+from app.config import ensure_env_loaded, settings
+from fastAPI.redis import close_redis
 from fastAPI.routers import configs, cron, details, listings, stats, taxonomy
+from fastAPI.routers.stats import start_stats_snapshot_worker, stop_stats_snapshot_worker
+from fastAPI.services.cache_writer import start_cache_writer, stop_cache_writer
+from fastAPI.services.cron_sync import start_crontab_sync_worker, stop_crontab_sync_worker
 
 # Ensure environment variables from the project-level .env are available.
-load_dotenv(find_dotenv())
+ensure_env_loaded()
 
 sentry_sdk.init(
     dsn=os.getenv("SENTRY_DSN"),
@@ -31,7 +37,6 @@ _port_str = os.getenv("FASTAPI_PORT", "8933")
 _openapi_url = os.getenv("FASTAPI_OPENAPI_URL")
 _docs_url = os.getenv("FASTAPI_DOCS_URL")
 _redoc_url = os.getenv("FASTAPI_REDOC_URL")
-_cors_origins = os.getenv("FASTAPI_CORS_ORIGINS", "http://localhost:8934")
 
 
 def _get_port() -> int:
@@ -41,22 +46,35 @@ def _get_port() -> int:
         raise ValueError(f"FASTAPI_PORT must be an integer (got {_port_str!r})") from exc
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage process-wide resources shared by all requests."""
+    start_crontab_sync_worker()
+    start_cache_writer()
+    start_stats_snapshot_worker()
+    yield
+    await stop_stats_snapshot_worker()
+    await stop_crontab_sync_worker()
+    await stop_cache_writer()
+    await close_redis()
+
+
 def create_app() -> FastAPI:
     """Instantiate the FastAPI application."""
     app = FastAPI(
         title="Vinted Scraper API",
         description="API surface for the Vinted scraping and scheduling platform.",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
-    # Allow local development until tighter policies are defined.
-    origins = [origin.strip() for origin in _cors_origins.split(",") if origin.strip()]
-    allow_all_origins = any(origin in {"*", "*:*"} for origin in origins)
-
+    # Origins come from FASTAPI_CORS_ORIGINS; browsers reject credentialed
+    # responses for a wildcard origin, so credentials are off in that case.
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"] , # Allow all origins for development
-        allow_credentials=True,
+        allow_origins=["*"] if settings.fastapi_cors_allow_all else settings.fastapi_cors_origins,
+        allow_credentials=not settings.fastapi_cors_allow_all,
         allow_methods=["*"],
         allow_headers=["*"],
     )
@@ -90,4 +108,11 @@ app = create_app()
 if __name__ == "__main__":  # pragma: no cover - manual execution helper
     import uvicorn
 
-    uvicorn.run("fastAPI.main:app", host=_host, port=_get_port(), reload=True)
+    uvicorn.run(
+        "fastAPI.main:app",
+        host=_host,
+        port=_get_port(),
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -1,51 +1,105 @@
 """Redis utilities for coordinating frontend/backend interactions."""
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import socket
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from dotenv import load_dotenv, find_dotenv
+from app.config import ensure_env_loaded
 
 try:
-    from redis.asyncio import Redis
+    from redis.asyncio import ConnectionPool, Redis
     from redis.exceptions import RedisError
 except ModuleNotFoundError:  # pragma: no cover - used during lightweight tests
+    ConnectionPool = None  # type: ignore
     Redis = None  # type: ignore
 
-load_dotenv(find_dotenv())
+    class RedisError(Exception):  # type: ignore[no-redef]
+        """Stand-in so callers can catch RedisError without redis installed."""
+
+ensure_env_loaded()
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
 
-_host_label = socket.gethostname().split(".")[0] if socket.gethostname() else "host"
+try:
+    _hostname = socket.gethostname()
+except OSError:  # pragma: no cover - hostname lookup is best-effort
+    _hostname = ""
+_host_label = _hostname.split(".")[0] if _hostname else "host"
 REDIS_CLIENT_NAME = os.getenv(
     "REDIS_CLIENT_NAME",
     f"client_vinted_fastapi_{_host_label}_{os.getpid()}",
 )
 
+_redis_pool: Optional["ConnectionPool"] = None
 _redis_client: Optional["Redis"] = None
 DETAIL_STATUS_KEY = "detail_status"
 DETAIL_STATUS_CHANNEL = "detail_status"
+CONFIGS_CACHE_KEYS = ("configs:list:all", "configs:list:active")
+CONFIGS_CACHE_TTL = 30
+
+
+def configs_cache_key(active_only: bool) -> str:
+    """Return the response-cache key for GET /api/configs."""
+    return CONFIGS_CACHE_KEYS[1] if active_only else CONFIGS_CACHE_KEYS[0]
+
+
+def query_cache_key(prefix: str, params: dict[str, Any]) -> str:
+    """Return a fixed-length cache key for a set of query parameters.
+
+    Parameters are serialized canonically and hashed, so user input such as
+    a search containing ``:`` cannot collide with another filter set.
+    """
+    canonical = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    return f"{prefix}:{digest}"
 
 
 def get_redis() -> Optional["Redis"]:
-    """Return a shared Redis client instance."""
-    global _redis_client
+    """Return a shared Redis client instance backed by a process-wide pool."""
+    global _redis_pool, _redis_client
     if Redis is None:
         return None
 
     if _redis_client is None:
-        _redis_client = Redis.from_url(
+        _redis_pool = ConnectionPool.from_url(
             REDIS_URL,
             encoding="utf-8",
             decode_responses=True,
             client_name=REDIS_CLIENT_NAME,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
         )
+        _redis_client = Redis(connection_pool=_redis_pool)
     return _redis_client
 
 
+async def close_redis() -> None:
+    """Disconnect the shared Redis pool (called on application shutdown)."""
+    global _redis_pool, _redis_client
+    pool = _redis_pool
+    _redis_pool = None
+    _redis_client = None
+    if pool is not None:
+        await pool.disconnect()
+
+
+async def invalidate_configs_cache() -> None:
+    """Drop cached /api/configs responses after a configuration changes."""
+    try:
+        client = get_redis()
+        if client is None:
+            return
+        await client.delete(*CONFIGS_CACHE_KEYS)
+    except (RedisError, AttributeError):
+        pass
+
+
 async def set_config_status(
     config_id: int,
     status: str,
@@ -67,8 +121,12 @@ async def set_config_status(
         client = get_redis()
         if client is None:
             return payload
-        await client.hset(f"config_status:{config_id}", mapping=payload)
-        await client.publish("config_status", json.dumps(payload))
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(f"config_status:{config_id}", mapping=payload)
+            pipe.publish("config_status", json.dumps(payload))
+            # Status changes accompany last_run_* writes; keep /api/configs fresh.
+            pipe.delete(*CONFIGS_CACHE_KEYS)
+            await pipe.execute()
     except (RedisError, AttributeError):
         # Redis is optional; swallow errors to avoid breaking primary flow.
         pass
@@ -127,8 +185,10 @@ async def set_detail_status(
         client = get_redis()
         if client is None:
             return payload
-        await client.hset(DETAIL_STATUS_KEY, mapping=payload)
-        await client.publish(DETAIL_STATUS_CHANNEL, json.dumps(payload))
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(DETAIL_STATUS_KEY, mapping=payload)
+            pipe.publish(DETAIL_STATUS_CHANNEL, json.dumps(payload))
+            await pipe.execute()
     except (RedisError, AttributeError):
         pass
 
@@ -2,8 +2,9 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import (
@@ -12,10 +13,19 @@ from app.api.schemas import (
     ScrapeConfigUpdate,
 )
 from app.db.models import ScrapeConfig
-from app.scheduler import sync_crontab
+from app.utils.logging import get_logger
 from fastAPI.dependencies import get_db, require_api_key
-from fastAPI.redis import get_config_status, set_config_status
-from fastAPI.services.scraper import RunInProgressError, schedule_manual_run
+from fastAPI.redis import (
+    CONFIGS_CACHE_TTL,
+    RedisError,
+    configs_cache_key,
+    get_config_status,
+    get_redis,
+    invalidate_configs_cache,
+    set_config_status,
+)
+from fastAPI.services.cron_sync import request_crontab_sync
+from fastAPI.services.scraper import RunInProgressError, is_run_active, schedule_manual_run
 from fastAPI.schemas import RuntimeStatusResponse
 
 router = APIRouter(
@@ -48,6 +58,10 @@ SYNC_CRON_FIELDS = {
     "healthcheck_ping_url",
 }
 
+_CONFIG_LIST_ADAPTER = TypeAdapter(list[ScrapeConfigResponse])
+
+logger = get_logger(__name__)
+
 
 @router.get("", response_model=list[ScrapeConfigResponse])
 async def list_configs(
@@ -55,6 +69,17 @@ async def list_configs(
     db: AsyncSession = Depends(get_db),
 ) -> list[ScrapeConfigResponse]:
     """Return scrape configurations."""
+    redis = get_redis()
+    cache_key = configs_cache_key(active_only)
+    if redis:
+        try:
+            cached = await redis.get(cache_key)
+        except RedisError as exc:  # Redis is optional; fall back to the database
+            logger.warning(f"Failed to read cached configs: {exc}")
+            cached, redis = None, None
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
     query = select(ScrapeConfig)
     if active_only:
         query = query.where(ScrapeConfig.is_active.is_(True))
@@ -63,7 +88,17 @@ async def list_configs(
     result = await db.execute(query)
     configs = result.scalars().all()
     print(f"DEBUG: list_configs retrieved {len(configs)} configurations from the database.")
-    return configs
+
+    body = _CONFIG_LIST_ADAPTER.dump_json(
+        _CONFIG_LIST_ADAPTER.validate_python(configs, from_attributes=True),
+        by_alias=True,
+    )
+    if redis:
+        try:
+            await redis.set(cache_key, body, ex=CONFIGS_CACHE_TTL)
+        except RedisError as exc:
+            logger.warning(f"Failed to cache configs: {exc}")
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("", response_model=ScrapeConfigResponse, status_code=201)
@@ -77,12 +112,10 @@ async def create_config(
     db.add(db_config)
     await db.commit()
     await db.refresh(db_config)
+    await invalidate_configs_cache()
 
     if db_config.cron_schedule:
-        try:
-            await sync_crontab()
-        except Exception as exc:  # pragma: no cover - defensive
-            raise HTTPException(status_code=500, detail=f"Failed to sync cron: {exc}") from exc
+        request_crontab_sync()
 
     return db_config
 
@@ -110,25 +143,27 @@ async def update_config(
     db: AsyncSession = Depends(get_db),
 ) -> ScrapeConfigResponse:
     """Update a scrape configuration."""
-    result = await db.execute(
-        select(ScrapeConfig).where(ScrapeConfig.id == config_id)
-    )
+    payload_data = payload.model_dump(exclude_unset=True)
+    if payload_data:
+        stmt = (
+            update(ScrapeConfig)
+            .where(ScrapeConfig.id == config_id)
+            .values(**payload_data)
+            .returning(ScrapeConfig)
+        )
+    else:
+        stmt = select(ScrapeConfig).where(ScrapeConfig.id == config_id)
+
+    result = await db.execute(stmt)
     config = result.scalar_one_or_none()
     if not config:
         raise HTTPException(status_code=404, detail="Configuration not found")
 
-    payload_data = payload.model_dump(exclude_unset=True)
-    for key, value in payload_data.items():
-        setattr(config, key, value)
-
     await db.commit()
-    await db.refresh(config)
+    await invalidate_configs_cache()
 
     if payload_data.keys() & SYNC_CRON_FIELDS:
-        try:
-            await sync_crontab()
-        except Exception as exc:  # pragma: no cover
-            raise HTTPException(status_code=500, detail=f"Failed to sync cron: {exc}") from exc
+        request_crontab_sync()
 
     return config
 
@@ -140,47 +175,49 @@ async def delete_config(
 ) -> None:
     """Delete a scrape configuration."""
     result = await db.execute(
-        select(ScrapeConfig).where(ScrapeConfig.id == config_id)
+        delete(ScrapeConfig)
+        .where(ScrapeConfig.id == config_id)
+        .returning(ScrapeConfig.id)
     )
-    config = result.scalar_one_or_none()
-
-    if not config:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Configuration not found")
 
-    await db.delete(config)
     await db.commit()
+    await invalidate_configs_cache()
+
+    request_crontab_sync()
 
+
+async def _schedule_run_in_background(config: ScrapeConfig) -> None:
+    """Start the scrape after the 202 response has been sent."""
     try:
-        await sync_crontab()
-    except Exception as exc:  # pragma: no cover
-        raise HTTPException(status_code=500, detail=f"Failed to sync cron: {exc}") from exc
+        await schedule_manual_run(config)
+    except RunInProgressError as exc:
+        # Lost a race with a concurrent trigger; that run reports status.
+        logger.warning(f"Manual run for config {config.id} not started: {exc}")
 
 
-@router.post("/{config_id}/run")
+@router.post("/{config_id}/run", status_code=202)
 async def trigger_config_run(
     config_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, str | int]:
-    """Trigger an on-demand scrape run."""
-    result = await db.execute(
-        select(ScrapeConfig).where(ScrapeConfig.id == config_id)
-    )
-    config = result.scalar_one_or_none()
-
+    """Queue an on-demand scrape run."""
+    config = await db.get(ScrapeConfig, config_id)
     if not config:
         raise HTTPException(status_code=404, detail="Configuration not found")
 
-    config.last_run_status = "queued"
-    config.last_run_at = datetime.now(tz=timezone.utc)
-    config.last_run_items = None
-    await db.commit()
+    if is_run_active(config.id):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Scrape config {config.id} is already running",
+        )
 
+    # The queued state is transient and lives in Redis only; the worker
+    # persists the final outcome to the database.
     await set_config_status(config.id, "queued", message="Scrape queued (manual)")
-
-    try:
-        await schedule_manual_run(config)
-    except RunInProgressError as exc:
-        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    background_tasks.add_task(_schedule_run_in_background, config)
 
     return {"config_id": config.id, "message": "Scrape queued"}
 
@@ -1,12 +1,12 @@
 import datetime as dt
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import ScrapeConfig
-from app.db.session import Session
 from app.scheduler import build_scrape_command, list_scheduled_jobs, sync_crontab
-from fastAPI.dependencies import require_api_key
+from fastAPI.dependencies import get_db, require_api_key
 from fastAPI.schemas import (
     CronCommandRequest,
     CronCommandResponse,
@@ -77,34 +77,44 @@ async def build_job_command(payload: CronCommandRequest) -> CronCommandResponse:
 
 @router.post("/health/{config_id}", dependencies=[Depends(require_api_key)])
 async def update_health_status(
-    config_id: int, payload: CronHealthUpdateRequest
+    config_id: int,
+    payload: CronHealthUpdateRequest,
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """Update the health status of a cron job."""
-    async with Session() as session:
-        result = await session.execute(
-            select(ScrapeConfig).where(ScrapeConfig.id == config_id)
+    result = await db.execute(
+        update(ScrapeConfig)
+        .where(ScrapeConfig.id == config_id)
+        .values(
+            last_health_status=payload.status,
+            last_health_check_at=dt.datetime.now(dt.timezone.utc),
         )
-        config = result.scalars().first()
-        if not config:
-            raise HTTPException(status_code=404, detail="Config not found")
+        .returning(ScrapeConfig.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Config not found")
 
-        config.last_health_status = payload.status
-        config.last_health_check_at = dt.datetime.now(dt.timezone.utc)
-        await session.commit()
+    await db.commit()
 
     return {"message": "Health status updated"}
 
 
 @router.get("/health/{config_id}", response_model=CronHealthStatus, dependencies=[])
-async def get_health_status(config_id: int) -> CronHealthStatus:
+async def get_health_status(
+    config_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> CronHealthStatus:
     """Get the health status of a cron job."""
-    async with Session() as session:
-        result = await session.execute(
-            select(ScrapeConfig).where(ScrapeConfig.id == config_id)
-        )
-        config = result.scalars().first()
-        if not config:
-            raise HTTPException(status_code=404, detail="Config not found")
+    result = await db.execute(
+        select(
+            ScrapeConfig.id,
+            ScrapeConfig.last_health_status,
+            ScrapeConfig.last_health_check_at,
+        ).where(ScrapeConfig.id == config_id)
+    )
+    config = result.first()
+    if not config:
+        raise HTTPException(status_code=404, detail="Config not found")
 
     logger.info(f"Health status for config {config_id}: status={config.last_health_status}, checked_at={config.last_health_check_at}")
     return CronHealthStatus(
@@ -1,25 +1,29 @@
 """Listings endpoints."""
-import json
-from typing import Optional
+import asyncio
+import base64
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from typing import NamedTuple, Optional
 import logging
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+import time
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    and_, case, exists, func, inspect, literal_column, or_, select, tuple_, type_coerce,
+)
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 import math
 
+from app.config import settings
 from app.api.schemas import (
     ListingDetail,
     ListingListResponse,
-    ListingResponse,
     PriceHistoryResponse,
-    ConditionResponse,
-    SourceResponse,
-    CategoryResponse,
-    PlatformResponse,
 )
 from app.db.models import (
     Listing,
@@ -29,10 +33,12 @@ from app.db.models import (
     ConditionOption,
     SourceOption,
 )
+from app.db.session import Session
 from app.utils.conditions import normalize_condition
 from app.utils.logging import get_logger
 from fastAPI.dependencies import get_db, require_api_key
-from fastAPI.redis import get_redis
+from fastAPI.redis import RedisError, get_redis, query_cache_key
+from fastAPI.services.cache_writer import enqueue_cache_write
 
 router = APIRouter(
     prefix="/api",
@@ -42,66 +48,197 @@ router = APIRouter(
 
 logger = get_logger(__name__)
 
+# price_change has no column; it is ranked from the previous price instead.
 SORTABLE_FIELDS = {
-    "last_seen_at": "last_seen_at",
-    "first_seen_at": "first_seen_at",
-    "price": "price_cents",
-    "title": "title",
-    "condition": "condition_option_id",
-    "category_id": "category_id",
-    "source": "source_option_id",
-    "platform_ids": "platform_ids",
-    "price_change": "price_change",
+    "last_seen_at": Listing.last_seen_at,
+    "first_seen_at": Listing.first_seen_at,
+    "price": Listing.price_cents,
+    "title": Listing.title,
+    "condition": Listing.condition_option_id,
+    "category_id": Listing.category_id,
+    "source": Listing.source_option_id,
+    "platform_ids": Listing.platform_ids,
+    "price_change": None,
 }
 
+_IS_POSTGRES = settings.database_url.startswith("postgresql")
 
+_LISTING_COLS = tuple(attr.key for attr in inspect(Listing).column_attrs)
 
-async def load_listings_to_cache(db: AsyncSession, redis):
-    logger.info("Clearing listings cache...")
-    keys = await redis.keys("listings:*")
-    if keys:
-        await redis.delete(*keys)
+# Enrichment reads only the two many-to-one options; join them in the same
+# SELECT and fail loudly if anything else would trigger a lazy load.
+_LISTING_LOAD_OPTIONS = (
+    joinedload(Listing.condition_option),
+    joinedload(Listing.source_option),
+    raiseload("*"),
+)
+_PRICE_HISTORY_ADAPTER = TypeAdapter(list[PriceHistoryResponse])
 
-    logger.info("Loading listings to cache...")
-    listings_query = select(Listing).options(selectinload(Listing.prices))
-    listings_result = await db.execute(listings_query)
-    listings = listings_result.scalars().all()
-    logger.info(f"Found {len(listings)} listings to load into cache.")
-
-    # Load master data for lookups
-    category_records = (await db.execute(select(CategoryOption.id, CategoryOption.name, CategoryOption.color))).all()
-    categories_map = {row.id: row.name for row in category_records}
-    await redis.set("categories", json.dumps([row._asdict() for row in category_records]), ex=3600)
-
-    platform_records = (await db.execute(select(PlatformOption.id, PlatformOption.name, PlatformOption.color))).all()
-    platforms = [row._asdict() for row in platform_records]
-    platforms_map = {row.id: row.name for row in platform_records}
-    await redis.set("platforms", json.dumps([row._asdict() for row in platform_records]), ex=3600)
-
-    condition_records = (await db.execute(select(ConditionOption.id, ConditionOption.code, ConditionOption.label, ConditionOption.color))).all()
-    conditions_map = {row.id: row for row in condition_records}
-    await redis.set("conditions", json.dumps([row._asdict() for row in condition_records]), ex=3600)
-
-    source_records = (await db.execute(select(SourceOption.id, SourceOption.code, SourceOption.label, SourceOption.color))).all()
-    sources_map = {row.id: row for row in source_records}
-    await redis.set("sources", json.dumps([row._asdict() for row in source_records]), ex=3600)
-
-    enriched_listings = []
-    for listing in listings:
-        logger.debug(f"Processing listing ID: {listing.id}")
-        logger.debug(f"Listing condition_option: {listing.condition_option}")
-        logger.debug(f"Listing source_option: {listing.source_option}")
-        logger.debug(f"Listing platform_ids: {listing.platform_ids}")
-        logger.debug(f"Listing price_cents: {listing.price_cents}")
-        logger.debug(f"Listing is_sold: {listing.is_sold}")
-
-        listing_data = {
+
+
+# Bump the version when the cached page shape changes to orphan old entries.
+LISTINGS_QUERY_CACHE_PREFIX = "listings:v1"
+
+# Listings fetched (and written to Redis) per round trip while rebuilding the cache.
+CACHE_LOAD_BATCH = 500
+
+# Enriched listings are cached one key per id and fetched per page with MGET.
+LISTING_ITEM_KEY_PREFIX = "listings:item"
+LISTING_ITEM_TTL = 3600
+
+# Distinct filter values across all listings, stored at warm-up.
+LISTINGS_AVAILABLE_KEY = "listings:available"
+
+# Keys deleted per pipeline round trip when clearing cached query pages.
+CACHE_SCAN_BATCH = 500
+
+# Seconds the taxonomy tables are kept in process memory between reloads.
+MASTER_DATA_CACHE_TTL = 300
+
+
+async def _delete_matching(redis, pattern: str) -> int:
+    """Delete keys matching ``pattern`` using SCAN and batched pipelines."""
+    deleted = 0
+    batch: list[str] = []
+    async for key in redis.scan_iter(match=pattern, count=CACHE_SCAN_BATCH):
+        batch.append(key)
+        if len(batch) >= CACHE_SCAN_BATCH:
+            deleted += await _delete_batch(redis, batch)
+            batch = []
+    if batch:
+        deleted += await _delete_batch(redis, batch)
+    return deleted
+
+
+async def _delete_batch(redis, keys: list[str]) -> int:
+    async with redis.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.delete(key)
+        results = await pipe.execute()
+    return sum(results)
+
+
+def _listing_item_key(listing_id: int) -> str:
+    return f"{LISTING_ITEM_KEY_PREFIX}:{listing_id}"
+
+
+async def _store_listing_items(redis, listing_dicts: Iterable[dict]) -> int:
+    """Write enriched listings to their per-id keys in one pipeline.
+
+    Each dict is serialized as soon as it is produced, so a generator input
+    never has more than one enriched listing alive at a time.
+    """
+    async with redis.pipeline(transaction=False) as pipe:
+        for listing_dict in listing_dicts:
+            pipe.set(
+                _listing_item_key(listing_dict["id"]),
+                orjson.dumps(listing_dict, option=orjson.OPT_NAIVE_UTC),
+                ex=LISTING_ITEM_TTL,
+            )
+        results = await pipe.execute()
+    return len(results)
+
+
+def _previous_price():
+    """Most recent recorded price that differs from the listing's current one.
+
+    Correlated against ``Listing`` so it is looked up per row in SQL instead
+    of loading and sorting full price histories.
+    """
+    return (
+        select(PriceHistory.price_cents)
+        .where(
+            PriceHistory.listing_id == Listing.id,
+            PriceHistory.price_cents.isnot(None),
+            PriceHistory.price_cents != Listing.price_cents,
+        )
+        .order_by(PriceHistory.observed_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+async def _execute_isolated(stmt):
+    """Execute a read-only statement on its own pooled session."""
+    async with Session() as session:
+        return await session.execute(stmt)
+
+
+_MASTER_DATA_STMTS = (
+    select(CategoryOption.id, CategoryOption.name, CategoryOption.color),
+    select(PlatformOption.id, PlatformOption.name, PlatformOption.color),
+    select(ConditionOption.id, ConditionOption.code, ConditionOption.label, ConditionOption.color),
+    select(SourceOption.id, SourceOption.code, SourceOption.label, SourceOption.color),
+)
+
+
+class _MasterData(NamedTuple):
+    categories: list[dict]
+    platforms: list[dict]
+    conditions: list[dict]
+    sources: list[dict]
+    categories_map: dict[int, str]
+    platforms_map: dict[int, str]
+    sources_by_code: dict[str, dict]
+
+
+_master_data: Optional[tuple[float, _MasterData]] = None
+_master_data_lock = asyncio.Lock()
+
+
+async def _get_master_data(refresh: bool = False) -> _MasterData:
+    """Return the taxonomy tables and their lookup maps.
+
+    Cached in process memory for MASTER_DATA_CACHE_TTL seconds; the four
+    tables are read concurrently, each on its own pooled session (an
+    AsyncSession cannot run statements concurrently).
+    """
+    global _master_data
+    if not refresh and _master_data and time.monotonic() < _master_data[0]:
+        return _master_data[1]
+
+    async with _master_data_lock:
+        if not refresh and _master_data and time.monotonic() < _master_data[0]:
+            return _master_data[1]
+        results = await asyncio.gather(*(_execute_isolated(stmt) for stmt in _MASTER_DATA_STMTS))
+        categories, platforms, conditions, sources = (
+            [row._asdict() for row in result.all()] for result in results
+        )
+        master_data = _MasterData(
+            categories=categories,
+            platforms=platforms,
+            conditions=conditions,
+            sources=sources,
+            categories_map={c["id"]: c["name"] for c in categories},
+            platforms_map={p["id"]: p["name"] for p in platforms},
+            sources_by_code={s["code"]: s for s in sources},
+        )
+        _master_data = (time.monotonic() + MASTER_DATA_CACHE_TTL, master_data)
+        return master_data
+
+
+def _enrich_listings(
+    listing_pairs,
+    categories_map: dict[int, str],
+    platforms_map: dict[int, str],
+    sources_by_code: dict[str, dict],
+) -> Iterator[dict]:
+    """Yield a ListingResponse dict per (Listing, previous_price_cents) row.
+
+    The dicts are built field-for-field from trusted database rows, so they
+    are not run through pydantic validation.
+    """
+    # Checked once per batch; the per-row debug line is skipped entirely
+    # unless DEBUG logging is on.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for listing, previous_price_cents in listing_pairs:
+        listing_dict = {
             "id": listing.id,
             "url": listing.url,
             "first_seen_at": listing.first_seen_at,
             "last_seen_at": listing.last_seen_at,
             "is_active": listing.is_active,
-            "is_visible": getattr(listing, 'is_visible', True),  # Default to True for old records
+            "is_visible": listing.is_visible if listing.is_visible is not None else True,  # Default to True for old records
             "is_sold": listing.is_sold,
             "details_scraped": listing.details_scraped,
             "title": listing.title,
@@ -121,18 +258,10 @@ async def load_listings_to_cache(db: AsyncSession, redis):
             "condition_option_id": listing.condition_option_id,
             "source_option_id": listing.source_option_id,
         }
-        listing_dict = ListingResponse(**listing_data).model_dump()
+        if debug:
+            logger.debug(f"Processing listing ID: {listing.id}")
 
         # Calculate price_change from PriceHistory
-        previous_price_cents = None
-        if listing.prices:
-            # Sort prices by observed_at descending
-            sorted_prices = sorted(listing.prices, key=lambda p: p.observed_at, reverse=True)
-            for price_entry in sorted_prices:
-                if price_entry.price_cents is not None and price_entry.price_cents != listing.price_cents:
-                    previous_price_cents = price_entry.price_cents
-                    break
-
         if listing.price_cents is not None and previous_price_cents is not None:
             if listing.price_cents > previous_price_cents:
                 listing_dict["price_change"] = "up"
@@ -164,12 +293,11 @@ async def load_listings_to_cache(db: AsyncSession, redis):
             listing_dict["source_option_id"] = source_obj.id
         elif listing.source:
             # Fallback: try to find source by code if source_option is not loaded
-            source_map_by_code = {s.code: s for s in sources_map.values()}
-            found_source = source_map_by_code.get(listing.source)
+            found_source = sources_by_code.get(listing.source)
             if found_source:
-                listing_dict["source_label"] = found_source.label
-                listing_dict["source_code"] = found_source.code
-                listing_dict["source_option_id"] = found_source.id
+                listing_dict["source_label"] = found_source["label"]
+                listing_dict["source_code"] = found_source["code"]
+                listing_dict["source_option_id"] = found_source["id"]
             else:
                 listing_dict["source_label"] = None
                 listing_dict["source_code"] = None
@@ -186,26 +314,74 @@ async def load_listings_to_cache(db: AsyncSession, redis):
             listing_dict["category_name"] = None
 
         # Populate platform_names
-        if listing.platform_ids:
-            platform_names = []
-            for p_id in listing.platform_ids:
-                found_platform = next((p for p in platforms if p["id"] == p_id), None)
-                if found_platform:
-                    platform_names.append(found_platform["name"])
-            listing_dict["platform_names"] = platform_names
-        else:
-            listing_dict["platform_names"] = None
-
-        # Convert datetime objects to ISO 8601 strings for JSON serialization
-        for key, value in listing_dict.items():
-            if isinstance(value, datetime):
-                listing_dict[key] = value.isoformat()
+        listing_dict["platform_names"] = (
+            [platforms_map[p_id] for p_id in listing.platform_ids if p_id in platforms_map]
+            if listing.platform_ids
+            else None
+        )
+        yield listing_dict
 
-        logger.debug(f"Final JSON for listing ID {listing.id}: {json.dumps(listing_dict)}")
-        enriched_listings.append(listing_dict)
 
-    await redis.set("listings", json.dumps(enriched_listings), ex=3600)
-    logger.info(f"Cached {len(enriched_listings)} listings.")
+async def load_listings_to_cache(db: AsyncSession, redis):
+    logger.info("Loading listings to cache...")
+    # Reload master data for lookups; this also refreshes the in-process copy.
+    master_data = await _get_master_data(refresh=True)
+
+    if _IS_POSTGRES:
+        # The warm-up reads every listing, so resolve all previous prices in
+        # one DISTINCT ON pass over price_history and LEFT JOIN them, rather
+        # than probing the index once per listing.
+        previous_prices = (
+            select(PriceHistory.listing_id, PriceHistory.price_cents)
+            .join(Listing, Listing.id == PriceHistory.listing_id)
+            .where(
+                PriceHistory.price_cents.isnot(None),
+                PriceHistory.price_cents != Listing.price_cents,
+            )
+            .distinct(PriceHistory.listing_id)
+            .order_by(PriceHistory.listing_id, PriceHistory.observed_at.desc())
+            .subquery("previous_prices")
+        )
+        listings_query = (
+            select(Listing, previous_prices.c.price_cents.label("previous_price_cents"))
+            .outerjoin(previous_prices, previous_prices.c.listing_id == Listing.id)
+        )
+    else:
+        listings_query = select(Listing, _previous_price().label("previous_price_cents"))
+    listings_query = (
+        listings_query
+        .options(*_LISTING_LOAD_OPTIONS)
+        .execution_options(yield_per=CACHE_LOAD_BATCH)
+    )
+    # Stream the table in batches so only one batch of ORM objects is alive
+    # at a time; each batch is enriched and written to its per-id keys
+    # before the next fetch.
+    listings_result = await db.stream(listings_query)
+    cached_count = 0
+    # The available_* filter values are gathered in the same pass.
+    available = _empty_available_filters()
+    async for listing_pairs in listings_result.partitions():
+        cached_count += await _store_listing_items(
+            redis,
+            _collect_available_filters(
+                _enrich_listings(
+                    listing_pairs,
+                    master_data.categories_map,
+                    master_data.platforms_map,
+                    master_data.sources_by_code,
+                ),
+                available,
+            ),
+        )
+    await _store_available_filters(redis, available)
+
+    # Drop the whole-catalog blob and master-data keys older deployments kept
+    # in Redis; master data now lives in process memory.
+    await redis.delete("listings", "categories", "platforms", "conditions", "sources")
+
+    logger.info("Clearing cached listing queries...")
+    await _delete_matching(redis, f"{LISTINGS_QUERY_CACHE_PREFIX}:*")
+    logger.info(f"Cached {cached_count} listings.")
 
 
 @router.post("/listings/load")
@@ -217,6 +393,206 @@ async def load_listings_endpoint(db: AsyncSession = Depends(get_db)):
     return {"message": "Listings loaded to cache."}
 
 
+def _listing_filters(
+    *,
+    search: Optional[str],
+    active_only: bool,
+    currency: Optional[str],
+    price_min: Optional[int],
+    price_max: Optional[int],
+    condition_id: Optional[int],
+    condition: Optional[str],
+    category_id: Optional[int],
+    platform_id: Optional[int],
+    source_id: Optional[int],
+    source: Optional[str],
+    is_sold: Optional[bool],
+) -> list:
+    """Translate the list_listings query parameters into WHERE clauses."""
+    filters = []
+    if active_only:
+        filters.append(Listing.is_active.is_(True))
+    if search:
+        filters.append(Listing.title.ilike(f"%{search}%"))
+    if currency:
+        filters.append(Listing.currency == currency)
+    if price_min is not None:
+        filters.append(Listing.price_cents >= price_min)
+    if price_max is not None:
+        filters.append(Listing.price_cents <= price_max)
+    if condition_id is not None:
+        filters.append(Listing.condition_option_id == condition_id)
+    if condition:
+        # Match the linked option by normalized code/label, or the raw text
+        # for listings that were never linked to an option.
+        _, condition_code, condition_label = normalize_condition(condition)
+        variants = {
+            value.lower()
+            for value in (condition.strip(), condition_code, condition_label)
+            if value
+        }
+        matching_options = select(ConditionOption.id).where(
+            or_(ConditionOption.code == condition_code, ConditionOption.label == condition_label)
+        )
+        filters.append(
+            or_(
+                Listing.condition_option_id.in_(matching_options),
+                and_(
+                    Listing.condition_option_id.is_(None),
+                    func.lower(Listing.condition).in_(variants),
+                ),
+            )
+        )
+    if category_id is not None:
+        filters.append(Listing.category_id == category_id)
+    if platform_id is not None:
+        if _IS_POSTGRES:
+            # platform_ids is JSONB on PostgreSQL; @> is served by its GIN index.
+            filters.append(
+                Listing.platform_ids.op("@>")(type_coerce([platform_id], postgresql.JSONB))
+            )
+        else:
+            # Elsewhere the list is JSON text and .contains() compiles to a
+            # LIKE on "[id]", which misses ids inside longer lists.
+            filters.append(
+                exists(
+                    select(literal_column("1"))
+                    .select_from(func.json_each(Listing.platform_ids))
+                    .where(literal_column("value") == platform_id)
+                )
+            )
+    if source_id is not None:
+        filters.append(Listing.source_option_id == source_id)
+    if source:
+        filters.append(
+            or_(
+                Listing.source_option_id.in_(
+                    select(SourceOption.id).where(SourceOption.code == source)
+                ),
+                and_(Listing.source_option_id.is_(None), Listing.source == source),
+            )
+        )
+    if is_sold is not None:
+        filters.append(Listing.is_sold.is_(is_sold))
+    return filters
+
+
+def _encode_cursor(last_seen_at: datetime, listing_id: int) -> str:
+    """Pack a keyset position into an opaque, URL-safe token."""
+    raw = f"{last_seen_at.isoformat()}|{listing_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(token: str) -> tuple[datetime, int]:
+    """Unpack a token produced by _encode_cursor."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        timestamp, _, listing_id = base64.urlsafe_b64decode(padded).decode().partition("|")
+        return datetime.fromisoformat(timestamp), int(listing_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _listing_order(sort_field: str, sort_order: str) -> tuple:
+    """ORDER BY clauses for a sort, with id as a stable tiebreaker."""
+    if sort_field not in SORTABLE_FIELDS:
+        logger.warning(f"Invalid sort_field: {sort_field}. Falling back to last_seen_at.")
+        sort_field = "last_seen_at"
+
+    if sort_field == "price_change":
+        # 'down' (price decreased) is generally more interesting for 'desc' sort
+        # 'up' (price increased) is generally more interesting for 'asc' sort
+        up_rank, down_rank = (1, 3) if sort_order == "asc" else (3, 1)
+        previous_price = _previous_price()
+        rank = case(
+            (Listing.price_cents > previous_price, up_rank),
+            (Listing.price_cents < previous_price, down_rank),
+            (Listing.price_cents == previous_price, 2),
+            else_=4,
+        )
+        return rank.asc(), Listing.id.desc()
+
+    column = SORTABLE_FIELDS[sort_field]
+    if sort_order == "desc":
+        return column.desc().nullslast(), Listing.id.desc()
+    return column.asc().nullsfirst(), Listing.id.asc()
+
+
+def _empty_available_filters() -> dict[str, set]:
+    return {
+        "currencies": set(),
+        "condition_ids": set(),
+        "category_ids": set(),
+        "platform_ids": set(),
+        "source_ids": set(),
+    }
+
+
+def _collect_available_filters(listing_dicts: Iterable[dict], available: dict[str, set]) -> Iterator[dict]:
+    """Pass listings through while recording the filter values they carry."""
+    for listing_dict in listing_dicts:
+        if listing_dict["currency"]:
+            available["currencies"].add(listing_dict["currency"])
+        if listing_dict["condition_option_id"]:
+            available["condition_ids"].add(listing_dict["condition_option_id"])
+        if listing_dict["category_id"]:
+            available["category_ids"].add(listing_dict["category_id"])
+        if listing_dict["platform_ids"]:
+            available["platform_ids"].update(listing_dict["platform_ids"])
+        if listing_dict["source_option_id"]:
+            available["source_ids"].add(listing_dict["source_option_id"])
+        yield listing_dict
+
+
+async def _store_available_filters(redis, available: dict[str, set]) -> None:
+    try:
+        await redis.set(
+            LISTINGS_AVAILABLE_KEY,
+            orjson.dumps({key: sorted(values) for key, values in available.items()}),
+            ex=LISTING_ITEM_TTL,
+        )
+    except RedisError as exc:  # the filters are recomputed from SQL on a miss
+        logger.warning(f"Failed to cache available filters: {exc}")
+
+
+async def _query_available_filters(db: AsyncSession) -> dict[str, set]:
+    """Distinct filter values present across all listings, read from SQL."""
+    available = _empty_available_filters()
+    available["currencies"].update((await db.execute(
+        select(Listing.currency).where(Listing.currency.isnot(None)).distinct()
+    )).scalars().all())
+    available["condition_ids"].update((await db.execute(
+        select(Listing.condition_option_id).where(Listing.condition_option_id.isnot(None)).distinct()
+    )).scalars().all())
+    available["category_ids"].update((await db.execute(
+        select(Listing.category_id).where(Listing.category_id.isnot(None)).distinct()
+    )).scalars().all())
+    available["source_ids"].update((await db.execute(
+        select(Listing.source_option_id).where(Listing.source_option_id.isnot(None)).distinct()
+    )).scalars().all())
+    # Listings share a handful of platform combinations; flatten the distinct ones.
+    platform_id_lists = (await db.execute(select(Listing.platform_ids).distinct())).scalars().all()
+    available["platform_ids"].update(p_id for p_ids in platform_id_lists for p_id in p_ids)
+    return available
+
+
+async def _get_available_filters(db: AsyncSession, redis) -> dict[str, set]:
+    """Filter values computed at warm-up, falling back to SQL if they expired."""
+    if redis:
+        try:
+            cached = await redis.get(LISTINGS_AVAILABLE_KEY)
+        except RedisError as exc:  # compute the filters from the database instead
+            logger.warning(f"Failed to read cached available filters: {exc}")
+            cached, redis = None, None
+        if cached:
+            return {key: set(values) for key, values in orjson.loads(cached).items()}
+
+    available = await _query_available_filters(db)
+    if redis:
+        await _store_available_filters(redis, available)
+    return available
+
+
 @router.get("/listings", response_model=ListingListResponse)
 async def list_listings(
     search: Optional[str] = None,
@@ -238,179 +614,190 @@ async def list_listings(
     page: int = Query(1, ge=1),
     page_size: int = Query(15, ge=1, le=100),
     limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor.token of the previous page"),
     db: AsyncSession = Depends(get_db),
-) -> ListingListResponse:
-    """Return listings with optional search and pagination."""
+) -> Response:
+    """Return listings with optional search and pagination.
+
+    Passing ``cursor`` (the previous page's ``next_cursor.token``) switches to
+    keyset pagination on (last_seen_at, id), which stays fast at any depth;
+    ``page`` is then only echoed back.
+    """
     redis = get_redis()
-    if not redis:
-        raise HTTPException(status_code=500, detail="Redis not available.")
 
     # Construct a cache key based on the query parameters
-    cache_key = f"listings:{search}:{active_only}:{sort_field}:{sort_order}:{currency}:{price_min}:{price_max}:{condition_id}:{condition}:{category_id}:{platform_id}:{source_id}:{source}:{is_sold}:{page}:{page_size}"
+    cache_key = query_cache_key(
+        LISTINGS_QUERY_CACHE_PREFIX,
+        {
+            "search": search,
+            "active_only": active_only,
+            "sort_field": sort_field,
+            "sort_order": sort_order,
+            "currency": currency,
+            "price_min": price_min,
+            "price_max": price_max,
+            "condition_id": condition_id,
+            "condition": condition,
+            "category_id": category_id,
+            "platform_id": platform_id,
+            "source_id": source_id,
+            "source": source,
+            "is_sold": is_sold,
+            "page": page,
+            "page_size": page_size,
+            "limit": limit,
+            "cursor": cursor,
+        },
+    )
 
     # Try to fetch the specific paginated/filtered data from the cache first
-    logger.info(f"Attempting to fetch specific query from cache with key: {cache_key}")
-    cached_data = await redis.get(cache_key)
-    if cached_data:
-        logger.info("Serving specific query from cache")
-        logger.debug(f"Cached data content: {cached_data[:500]}...")
-        return json.loads(cached_data)
-
-    logger.info("Specific query not in cache, loading all listings from main cache or DB.")
-
-    # Load all enriched listings from the main cache
-    all_listings_json = await redis.get("listings")
-    if not all_listings_json:
-        logger.info("Main 'listings' cache is empty, loading from database via load_listings_to_cache...")
-        await load_listings_to_cache(db, redis)
-        all_listings_json = await redis.get("listings") # Re-fetch after loading
-        if not all_listings_json:
-            raise HTTPException(status_code=500, detail="Failed to load listings into cache.")
-        logger.info("Main 'listings' cache populated.")
-
-    all_listings = json.loads(all_listings_json)
-    logger.info(f"Loaded {len(all_listings)} listings from main cache.")
-
-    # Load master data for lookups (these should also be cached by load_listings_to_cache)
-    categories_data = await redis.get("categories")
-    categories = json.loads(categories_data) if categories_data else []
-    platforms_data = await redis.get("platforms")
-    platforms = json.loads(platforms_data) if platforms_data else []
-    conditions_data = await redis.get("conditions")
-    conditions = json.loads(conditions_data) if conditions_data else []
-    sources_data = await redis.get("sources")
-    sources = json.loads(sources_data) if sources_data else []
-
-    # Create maps for quick lookup
-    categories_map = {c["id"]: c["name"] for c in categories}
-    sources_map = {s["code"]: s for s in sources}
-    conditions_map = {c["id"]: c for c in conditions} # For condition filtering by code/label
-
-    # Apply filters in-memory
-    filtered_listings = []
-    for listing in all_listings:
-        if active_only and not listing.get("is_active"):
-            continue
-        if search and search.lower() not in listing.get("title", "").lower():
-            continue
-        if currency and listing.get("currency") != currency:
-            continue
-        if price_min is not None and listing.get("price_cents", 0) < price_min:
-            continue
-        if price_max is not None and listing.get("price_cents", 0) > price_max:
-            continue
-        if condition_id is not None and listing.get("condition_option_id") != condition_id:
-            continue
-        if condition:
-            # Normalize the query condition for comparison
-            _, query_condition_code, query_condition_label = normalize_condition(condition)
-            listing_condition_code = listing.get("condition_code")
-            listing_condition_label = listing.get("condition_label")
-
-            if not (listing_condition_code == query_condition_code or listing_condition_label == query_condition_label):
-                continue
-        if category_id is not None and listing.get("category_id") != category_id:
-            continue
-        if platform_id is not None and listing.get("platform_ids") and platform_id not in listing["platform_ids"]:
-            continue
-        if source_id is not None and listing.get("source_option_id") != source_id:
-            continue
-        if source:
-            listing_source_code = listing.get("source_code")
-            if not (listing_source_code and listing_source_code == source):
-                continue
-        if is_sold is not None and listing.get("is_sold") != is_sold:
-            continue
-
-        filtered_listings.append(listing)
-
-    logger.info(f"After filtering, {len(filtered_listings)} listings remain.")
-
-    # Apply sorting in-memory
-    if sort_field in SORTABLE_FIELDS:
-        if sort_field == "price_change":
-            # Define a custom order for price_change
-            # 'down' (price decreased) is generally more interesting for 'desc' sort
-            # 'up' (price increased) is generally more interesting for 'asc' sort
-            price_change_order = {"down": 1, "same": 2, "up": 3, None: 4}
-            if sort_order == "asc":
-                price_change_order = {"up": 1, "same": 2, "down": 3, None: 4}
-
-            filtered_listings.sort(key=lambda item: price_change_order.get(item.get("price_change"), 4), reverse=False) # Reverse is handled by custom order
-        else:
-            # Determine the actual key to sort by in the dictionary
-            actual_sort_key = SORTABLE_FIELDS[sort_field]
-
-            # Handle potential missing keys or None values during sorting
-            def get_sort_value(item):
-                value = item.get(actual_sort_key)
-                # Convert datetime strings back to datetime objects for proper sorting if needed
-                if isinstance(value, str) and ('_at' in actual_sort_key or 'seen_at' in actual_sort_key):
-                    try:
-                        return datetime.fromisoformat(value)
-                    except ValueError:
-                        pass # Fallback to string comparison if parsing fails
-                return value
-
-            filtered_listings.sort(key=get_sort_value, reverse=(sort_order == "desc"))
-    else:
-        logger.warning(f"Invalid sort_field: {sort_field}. Skipping sorting.")
+    if redis:
+        try:
+            cached_data = await redis.get(cache_key)
+        except RedisError as exc:  # Redis is optional; treat it as a cache miss
+            logger.warning(f"Failed to read cached listings query: {exc}")
+            cached_data, redis = None, None
+        if cached_data:
+            logger.info("Serving specific query from cache")
+            return Response(content=cached_data, media_type="application/json")
+
+    logger.info("Specific query not in cache, querying the database.")
 
-    # Apply pagination in-memory
-    total = len(filtered_listings)
     if limit:
-        paginated_listings = filtered_listings[:limit]
         page = 1 # When limit is used, page and page_size are effectively overridden
         page_size = limit
+    offset = (page - 1) * page_size
+
+    keyset_sort = sort_field == "last_seen_at" and sort_order == "desc"
+    if cursor is not None and not keyset_sort:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination requires sort_field=last_seen_at and sort_order=desc",
+        )
+
+    # Filtering, sorting and pagination run in SQL against the listings
+    # indexes; only the requested page is loaded and enriched.
+    filters = _listing_filters(
+        search=search,
+        active_only=active_only,
+        currency=currency,
+        price_min=price_min,
+        price_max=price_max,
+        condition_id=condition_id,
+        condition=condition,
+        category_id=category_id,
+        platform_id=platform_id,
+        source_id=source_id,
+        source=source,
+        is_sold=is_sold,
+    )
+    total = (await db.execute(
+        select(func.count()).select_from(Listing).where(*filters)
+    )).scalar_one()
+    # Pages fetch one extra row to learn has_next.
+    page_query = (
+        select(Listing.id, Listing.last_seen_at)
+        .where(*filters)
+        .order_by(*_listing_order(sort_field, sort_order))
+        .limit(page_size + 1)
+    )
+    if cursor is not None:
+        # Keyset page: seek past the cursor on (last_seen_at, id) instead of
+        # scanning and discarding OFFSET rows.
+        cursor_last_seen_at, cursor_id = _decode_cursor(cursor)
+        page_query = page_query.where(
+            tuple_(Listing.last_seen_at, Listing.id) < tuple_(cursor_last_seen_at, cursor_id)
+        )
     else:
-        offset = (page - 1) * page_size
-        paginated_listings = filtered_listings[offset : offset + page_size]
+        page_query = page_query.offset(offset)
+    page_rows = (await db.execute(page_query)).all()
+    has_next = len(page_rows) > page_size
+    page_rows = page_rows[:page_size]
+    page_ids = [row.id for row in page_rows]
+
+    # Serve enriched listings from their per-id keys; only the misses are
+    # loaded and enriched from the database. Items are kept as serialized
+    # JSON and embedded in the response with orjson.Fragment, so cached items
+    # are never parsed and re-encoded.
+    items_by_id: dict[int, orjson.Fragment] = {}
+    if redis and page_ids:
+        try:
+            cached_items = await redis.mget([_listing_item_key(listing_id) for listing_id in page_ids])
+        except RedisError as exc:
+            logger.warning(f"Failed to read cached listing items: {exc}")
+            cached_items, redis = [], None
+        for listing_id, cached_item in zip(page_ids, cached_items):
+            if cached_item:
+                items_by_id[listing_id] = orjson.Fragment(cached_item)
+
+    master_data = await _get_master_data()
+    missing_ids = [listing_id for listing_id in page_ids if listing_id not in items_by_id]
+    if missing_ids:
+        missing_result = await db.execute(
+            select(Listing, _previous_price().label("previous_price_cents"))
+            .options(*_LISTING_LOAD_OPTIONS)
+            .where(Listing.id.in_(missing_ids))
+        )
+        for item in _enrich_listings(
+            missing_result.all(),
+            master_data.categories_map,
+            master_data.platforms_map,
+            master_data.sources_by_code,
+        ):
+            item_json = orjson.dumps(item, option=orjson.OPT_NAIVE_UTC)
+            items_by_id[item["id"]] = orjson.Fragment(item_json)
+            if redis:
+                enqueue_cache_write(_listing_item_key(item["id"]), item_json, LISTING_ITEM_TTL)
+    paginated_listings = [items_by_id[listing_id] for listing_id in page_ids if listing_id in items_by_id]
 
     total_pages = int(math.ceil(total / page_size)) if page_size > 0 else 1
 
-    # Prepare the response
-    # Extract unique values from all_listings for available filters
-    unique_currencies = sorted(list(set(l["currency"] for l in all_listings if l["currency"])))
-    unique_condition_ids = set(l["condition_option_id"] for l in all_listings if l.get("condition_option_id"))
-    unique_category_ids = set(l["category_id"] for l in all_listings if l.get("category_id"))
-    unique_platform_ids_flat = set()
-    for l in all_listings:
-        if l.get("platform_ids"):
-            unique_platform_ids_flat.update(l["platform_ids"])
-    unique_source_ids = set(l["source_option_id"] for l in all_listings if l.get("source_option_id"))
-
-    filtered_available_conditions = [ConditionResponse(**c) for c in conditions if c["id"] in unique_condition_ids]
-    filtered_available_categories = [CategoryResponse(**c) for c in categories if c["id"] in unique_category_ids]
-    filtered_available_platforms = [PlatformResponse(**p) for p in platforms if p["id"] in unique_platform_ids_flat]
-    filtered_available_sources = [SourceResponse(**s) for s in sources if s["id"] in unique_source_ids]
-
-    response = ListingListResponse(
-        items=paginated_listings,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=(page * page_size) < total,
-        available_currencies=unique_currencies,
-        available_conditions=filtered_available_conditions,
-        available_categories=filtered_available_categories,
-        available_platforms=filtered_available_platforms,
-        available_sources=filtered_available_sources,
-    )
+    next_cursor = None
+    if keyset_sort and has_next and page_rows:
+        last = page_rows[-1]
+        next_cursor = {
+            "last_seen_at": last.last_seen_at,
+            "id": last.id,
+            "token": _encode_cursor(last.last_seen_at, last.id),
+        }
 
-    # Cache the response for this specific query
-    await redis.set(cache_key, response.model_dump_json(), ex=3600)
-    logger.info(f"Cached specific query result for key: {cache_key}")
+    # Only offer filter values that occur in the listings table.
+    available = await _get_available_filters(db, redis)
+
+    # Items are already shaped like ListingResponse; serialize the page
+    # straight from dicts instead of validating a model per listing.
+    response = ORJSONResponse({
+        "items": paginated_listings,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
+        "available_currencies": sorted(available["currencies"]),
+        "available_conditions": [c for c in master_data.conditions if c["id"] in available["condition_ids"]],
+        "available_categories": [c for c in master_data.categories if c["id"] in available["category_ids"]],
+        "available_platforms": [p for p in master_data.platforms if p["id"] in available["platform_ids"]],
+        "available_sources": [s for s in master_data.sources if s["id"] in available["source_ids"]],
+    })
+
+    # Cache the response for this specific query; the write is batched with
+    # other requests' cache writes into one pipeline off the request path.
+    if redis:
+        enqueue_cache_write(cache_key, response.body, 3600)
 
     return response
 
 @router.post("/listings/cache/clear")
 async def clear_listings_cache():
     """Clear the Redis cache for listings."""
+    global _master_data
+    _master_data = None
     redis = get_redis()
     if redis:
         await redis.delete("listings", "categories", "platforms", "conditions", "sources")
-        logger.info("Cleared listings cache.")
+        cleared = await _delete_matching(redis, "listings:*")
+        logger.info(f"Cleared listings cache ({cleared} cached queries).")
         return {"message": "Cleared listings cache."}
     return {"message": "Redis not available."}
 
@@ -436,12 +823,9 @@ async def get_listing(
     )
     prices = price_result.scalars().all()
 
-    listing_dict = dict(listing.__dict__)
-    listing_dict.pop("_sa_instance_state", None)
+    listing_dict = {key: getattr(listing, key) for key in _LISTING_COLS}
 
     return ListingDetail(
         **listing_dict,
-        price_history=[
-            PriceHistoryResponse.model_validate(p) for p in prices
-        ],
+        price_history=_PRICE_HISTORY_ADAPTER.validate_python(prices, from_attributes=True),
     )
@@ -1,499 +1,415 @@
 """Stats endpoints."""
-from datetime import datetime, timedelta
-
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, func, and_, case, literal_column, or_, DATE
+import asyncio
+import hashlib
+from datetime import date, datetime, time, timedelta
+from time import monotonic
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import Float, select, func, and_, bindparam, case, cast, literal_column, or_, text, DATE
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.api.schemas import ListingsByPeriod, ListingsByPeriodResponse, StatsResponse
 from app.db.models import Listing, ScrapeConfig, PriceHistory, SourceOption
+from app.db.session import Session
+from app.utils.logging import get_logger
 from fastAPI.dependencies import get_db, require_api_key
+from fastAPI.redis import RedisError, get_redis
 
 router = APIRouter(prefix="/api", tags=["stats"], dependencies=[Depends(require_api_key)])
 
+logger = get_logger(__name__)
 
-@router.get("/stats", response_model=StatsResponse)
-async def read_stats(db: AsyncSession = Depends(get_db)) -> StatsResponse:
-    """Return aggregated dashboard statistics."""
-    try:
-        today = datetime.utcnow().date()
-        yesterday = today - timedelta(days=1)
-        day_before_yesterday = today - timedelta(days=2)
-        day_before_previous_seven_days_ago = today - timedelta(days=9) # 7 days before day_before_yesterday
-        day_before_previous_thirty_days_ago = today - timedelta(days=60) # 30 days before day_before_yesterday
-        seven_days_ago = today - timedelta(days=7)
-        thirty_days_ago = today - timedelta(days=30)
-
-        total_listings = (
-            await db.execute(select(func.count()).select_from(Listing))
-        ).scalar()
-
-        active_listings = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(Listing.is_active.is_(True))
-            )
-        ).scalar()
+STATS_CACHE_PREFIX = "stats:v1"
+STATS_CACHE_TTL = 30
+# Snapshots published by the background refresher outlive a few missed
+# refreshes before requests fall back to computing the stats themselves.
+STATS_SNAPSHOT_TTL = 4 * STATS_CACHE_TTL
+STATS_REFRESH_LOCK_KEY = "stats:refresh-lock"
 
-        total_scraped_today = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(func.date(Listing.first_seen_at) == today)
-            )
-        ).scalar()
+_IS_POSTGRES = settings.database_url.startswith("postgresql")
 
-        total_scraped_previous_day = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(func.date(Listing.first_seen_at) == yesterday)
-            )
-        ).scalar()
 
-        total_scraped_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(func.date(Listing.first_seen_at) == day_before_yesterday)
-            )
-        ).scalar()
+async def _execute_isolated(stmt):
+    """Execute a read-only statement on its own pooled session."""
+    async with Session() as session:
+        return await session.execute(stmt)
 
-        active_configs = (
-            await db.execute(
-                select(func.count())
-                .select_from(ScrapeConfig)
-                .where(ScrapeConfig.is_active.is_(True))
-            )
-        ).scalar()
 
-        avg_price_cents = (
-            await db.execute(
-                select(func.avg(Listing.price_cents)).where(
-                    and_(Listing.is_active.is_(True), Listing.price_cents.isnot(None))
-                )
-            )
-        ).scalar()
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
 
-        min_price_cents = (
-            await db.execute(
-                select(func.min(Listing.price_cents)).where(
-                    and_(Listing.is_active.is_(True), Listing.price_cents.isnot(None))
-                )
-            )
-        ).scalar()
 
-        max_price_cents = (
-            await db.execute(
-                select(func.max(Listing.price_cents)).where(
-                    and_(Listing.is_active.is_(True), Listing.price_cents.isnot(None))
-                )
-            )
-        ).scalar()
+# Day boundaries of the stats windows, in days before today. They are bound
+# per request, so the statements below are built once and the same compiled
+# SQL is reused on every call.
+_STATS_WINDOW_DAYS = {
+    "tomorrow": -1,
+    "today": 0,
+    "yesterday": 1,
+    "day_before_yesterday": 2,
+    "seven_days_ago": 7,
+    "fourteen_days_ago": 14,
+    "thirty_days_ago": 30,
+    "sixty_days_ago": 60,
+}
 
-        total_scraped_last_7_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(func.date(Listing.first_seen_at) >= seven_days_ago)
-            )
-        ).scalar()
 
-        total_scraped_last_30_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(func.date(Listing.first_seen_at) >= thirty_days_ago)
-            )
-        ).scalar()
-
-        total_scraped_previous_7_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) >= seven_days_ago - timedelta(days=7),
-                        func.date(Listing.first_seen_at) < seven_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        total_scraped_previous_30_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) >= thirty_days_ago - timedelta(days=30),
-                        func.date(Listing.first_seen_at) < thirty_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        # New metrics for day_before_previous
-        total_scraped_last_7_days_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) >= day_before_yesterday - timedelta(days=6),
-                        func.date(Listing.first_seen_at) <= day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        total_scraped_last_30_days_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) >= day_before_yesterday - timedelta(days=29),
-                        func.date(Listing.first_seen_at) <= day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        active_listings_last_7_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(True),
-                        func.date(Listing.first_seen_at) >= seven_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        active_listings_last_30_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(True),
-                        func.date(Listing.first_seen_at) >= thirty_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        active_listings_last_7_days_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(True),
-                        func.date(Listing.first_seen_at) >= day_before_yesterday - timedelta(days=6),
-                        func.date(Listing.first_seen_at) <= day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        active_listings_last_30_days_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(True),
-                        func.date(Listing.first_seen_at) >= day_before_yesterday - timedelta(days=29),
-                        func.date(Listing.first_seen_at) <= day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        inactive_listings_today = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(False),
-                        func.date(Listing.first_seen_at) == today,
-                    )
-                )
-            )
-        ).scalar()
-
-        inactive_listings_last_7_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(False),
-                        func.date(Listing.first_seen_at) >= seven_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        inactive_listings_last_30_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(False),
-                        func.date(Listing.first_seen_at) >= thirty_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        inactive_listings_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(False),
-                        func.date(Listing.first_seen_at) == day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        inactive_listings_last_7_days_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(False),
-                        func.date(Listing.first_seen_at) >= day_before_yesterday - timedelta(days=6),
-                        func.date(Listing.first_seen_at) <= day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        inactive_listings_last_30_days_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(False),
-                        func.date(Listing.first_seen_at) >= day_before_yesterday - timedelta(days=29),
-                        func.date(Listing.first_seen_at) <= day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        active_listings_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        Listing.is_active.is_(True),
-                        func.date(Listing.first_seen_at) == day_before_yesterday,
-                    )
-                )
-            )
-        ).scalar()
-
-        # Price change calculations using PriceHistory
-        # Subquery to get ranked prices for each listing
-        ranked_prices_subquery = (
-            select(
-                PriceHistory.listing_id,
-                PriceHistory.price_cents,
-                func.row_number()
-                .over(
-                    partition_by=PriceHistory.listing_id,
-                    order_by=PriceHistory.observed_at.desc(),
-                )
-                .label("rn"),
-            )
-            .filter(PriceHistory.price_cents.isnot(None))
-            .subquery("ranked_prices")
-        )
+def _stats_window_params(today: date) -> dict[str, datetime]:
+    return {
+        name: _day_start(today - timedelta(days=days))
+        for name, days in _STATS_WINDOW_DAYS.items()
+    }
 
-        # Subquery to get current and previous prices for each listing
-        current_and_previous_prices_subquery = (
-            select(
-                ranked_prices_subquery.c.listing_id,
-                func.max(case((ranked_prices_subquery.c.rn == 1, ranked_prices_subquery.c.price_cents), else_=None)).label("current_price"),
-                func.max(case((ranked_prices_subquery.c.rn == 2, ranked_prices_subquery.c.price_cents), else_=None)).label("previous_price"),
-            )
-            .group_by(ranked_prices_subquery.c.listing_id)
-            .having(func.count(ranked_prices_subquery.c.price_cents) > 1) # Only consider listings with at least two price entries
-            .subquery("current_and_previous_prices")
+
+def _first_seen_since(start: str):
+    return Listing.first_seen_at >= bindparam(start)
+
+
+def _first_seen_between(start: str, end: str):
+    """Listings first seen between two bound day boundaries, as [start, end).
+
+    Compares the raw timestamp against a half-open range instead of
+    func.date(first_seen_at), so an index on first_seen_at can serve it.
+    """
+    return and_(
+        Listing.first_seen_at >= bindparam(start),
+        Listing.first_seen_at < bindparam(end),
+    )
+
+
+_is_active = Listing.is_active.is_(True)
+_is_inactive = Listing.is_active.is_(False)
+_seen_today = _first_seen_between("today", "tomorrow")
+_seen_last_7_days = _first_seen_since("seven_days_ago")
+_seen_last_30_days = _first_seen_since("thirty_days_ago")
+_active_priced = and_(_is_active, Listing.price_cents.isnot(None))
+
+# Every listing figure comes from one scan with conditional aggregates
+# instead of a separate COUNT/AVG/MIN/MAX round trip per figure. Columns are
+# labelled with their StatsResponse field names and typed in SQL (COUNT is
+# never NULL; AVG is cast from numeric to float), so the row maps straight
+# onto the response.
+_LISTING_STATS_STMT = select(
+    func.count().label("total_listings"),
+    func.count().filter(_is_active).label("active_listings"),
+    func.count().filter(_seen_today).label("total_scraped_today"),
+    func.count()
+    .filter(_first_seen_between("yesterday", "today"))
+    .label("total_scraped_previous_day"),
+    func.count()
+    .filter(_first_seen_between("day_before_yesterday", "yesterday"))
+    .label("total_scraped_day_before_previous"),
+    func.count().filter(_seen_last_7_days).label("total_scraped_last_7_days"),
+    func.count().filter(_seen_last_30_days).label("total_scraped_last_30_days"),
+    func.count()
+    .filter(_first_seen_between("fourteen_days_ago", "seven_days_ago"))
+    .label("total_scraped_previous_7_days"),
+    func.count()
+    .filter(_first_seen_between("sixty_days_ago", "thirty_days_ago"))
+    .label("total_scraped_previous_30_days"),
+    func.count().filter(and_(_is_active, _seen_last_7_days)).label("active_listings_last_7_days"),
+    func.count().filter(and_(_is_active, _seen_last_30_days)).label("active_listings_last_30_days"),
+    func.count().filter(and_(_is_inactive, _seen_today)).label("inactive_listings_today"),
+    func.count().filter(and_(_is_inactive, _seen_last_7_days)).label("inactive_listings_last_7_days"),
+    func.count().filter(and_(_is_inactive, _seen_last_30_days)).label("inactive_listings_last_30_days"),
+    cast(func.avg(Listing.price_cents).filter(_active_priced), Float).label("avg_price_cents"),
+    func.min(Listing.price_cents).filter(_active_priced).label("min_price_cents"),
+    func.max(Listing.price_cents).filter(_active_priced).label("max_price_cents"),
+).select_from(Listing)
+
+_ACTIVE_CONFIGS_STMT = (
+    select(func.count())
+    .select_from(ScrapeConfig)
+    .where(ScrapeConfig.is_active.is_(True))
+)
+
+
+# Price change counts computed from PriceHistory. This is the fallback when
+# the listing_price_changes view is unavailable (SQLite, or the migration has
+# not run yet).
+# Subquery to get ranked prices for each listing
+_ranked_prices = (
+    select(
+        PriceHistory.listing_id,
+        PriceHistory.price_cents,
+        func.row_number()
+        .over(
+            partition_by=PriceHistory.listing_id,
+            order_by=PriceHistory.observed_at.desc(),
         )
+        .label("rn"),
+    )
+    .filter(PriceHistory.price_cents.isnot(None))
+    .subquery("ranked_prices")
+)
+
+# Subquery to get current and previous prices for each listing
+_current_and_previous_prices = (
+    select(
+        _ranked_prices.c.listing_id,
+        func.max(case((_ranked_prices.c.rn == 1, _ranked_prices.c.price_cents), else_=None)).label("current_price"),
+        func.max(case((_ranked_prices.c.rn == 2, _ranked_prices.c.price_cents), else_=None)).label("previous_price"),
+    )
+    .group_by(_ranked_prices.c.listing_id)
+    .having(func.count(_ranked_prices.c.price_cents) > 1) # Only consider listings with at least two price entries
+    .subquery("current_and_previous_prices")
+)
+
+# One pass over the ranked prices for all three counts.
+_PRICE_CHANGE_COUNTS_STMT = select(
+    func.count()
+    .filter(_current_and_previous_prices.c.current_price > _current_and_previous_prices.c.previous_price)
+    .label("increased"),
+    func.count()
+    .filter(_current_and_previous_prices.c.current_price < _current_and_previous_prices.c.previous_price)
+    .label("decreased"),
+    func.count()
+    .filter(_current_and_previous_prices.c.current_price == _current_and_previous_prices.c.previous_price)
+    .label("unchanged"),
+).select_from(_current_and_previous_prices)
+
+_PRICE_CHANGE_VIEW_STMT = text(
+    "SELECT "
+    "count(*) FILTER (WHERE current_price > previous_price) AS increased, "
+    "count(*) FILTER (WHERE current_price < previous_price) AS decreased, "
+    "count(*) FILTER (WHERE current_price = previous_price) AS unchanged "
+    f'FROM "{settings.schema}".listing_price_changes'
+)
+
+
+async def _load_price_change_counts() -> tuple[int, int, int]:
+    """Return (increased, decreased, unchanged) listing price counts.
+
+    PostgreSQL reads the precomputed listing_price_changes view in one
+    query; elsewhere, or before the view exists, the counts are computed
+    from price_history.
+    """
+    row = None
+    if _IS_POSTGRES:
+        try:
+            row = (await _execute_isolated(_PRICE_CHANGE_VIEW_STMT)).one()
+        except DBAPIError as exc:
+            logger.warning(f"listing_price_changes view unavailable, using price_history: {exc}")
+    if row is None:
+        row = (await _execute_isolated(_PRICE_CHANGE_COUNTS_STMT)).one()
+    return row.increased, row.decreased, row.unchanged
+
+
+# Per-source counts: listings are grouped by source_option_id first
+# (ix_listings_source_option_id), so only one row per source is joined to
+# source_options for its label. Source labels are unique in the taxonomy.
+_listings_per_source = (
+    select(
+        Listing.source_option_id,
+        func.count().label("total_items"),
+        func.count().filter(Listing.is_active.is_(True)).label("active_items"),
+        func.count().filter(Listing.is_active.is_(False)).label("inactive_items"),
+    )
+    .where(Listing.source_option_id.isnot(None))
+    .group_by(Listing.source_option_id)
+    .subquery("listings_per_source")
+)
 
-        price_increase_count = (
-            await db.execute(
-                select(func.count())
-                .select_from(current_and_previous_prices_subquery)
-                .where(
-                    current_and_previous_prices_subquery.c.current_price > current_and_previous_prices_subquery.c.previous_price
-                )
-            )
-        ).scalar()
-
-        price_decrease_count = (
-            await db.execute(
-                select(func.count())
-                .select_from(current_and_previous_prices_subquery)
-                .where(
-                    current_and_previous_prices_subquery.c.current_price < current_and_previous_prices_subquery.c.previous_price
-                )
-            )
-        ).scalar()
-
-        price_unchanged_count = (
-            await db.execute(
-                select(func.count())
-                .select_from(current_and_previous_prices_subquery)
-                .where(
-                    current_and_previous_prices_subquery.c.current_price == current_and_previous_prices_subquery.c.previous_price
-                )
-            )
-        ).scalar()
+_SOURCE_STATS_STMT = select(
+    SourceOption.label,
+    _listings_per_source.c.total_items,
+    _listings_per_source.c.active_items,
+    _listings_per_source.c.inactive_items,
+).join(_listings_per_source, _listings_per_source.c.source_option_id == SourceOption.id)
 
-        total_listings_previous_day = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(func.date(Listing.first_seen_at) == yesterday)
-            )
-        ).scalar()
-
-        total_listings_previous_7_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) < seven_days_ago,
-                        func.date(Listing.first_seen_at) >= seven_days_ago - timedelta(days=7),
-                    )
-                )
-            )
-        ).scalar()
-
-        total_listings_previous_30_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) < thirty_days_ago,
-                        func.date(Listing.first_seen_at) >= thirty_days_ago - timedelta(days=30),
-                    )
-                )
-            )
-        ).scalar()
 
-        total_listings_day_before_previous = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(func.date(Listing.first_seen_at) == day_before_yesterday)
-            )
-        ).scalar()
-
-        total_scraped_previous_7_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) >= seven_days_ago - timedelta(days=7),
-                        func.date(Listing.first_seen_at) < seven_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        total_scraped_previous_30_days = (
-            await db.execute(
-                select(func.count())
-                .select_from(Listing)
-                .where(
-                    and_(
-                        func.date(Listing.first_seen_at) >= thirty_days_ago - timedelta(days=30),
-                        func.date(Listing.first_seen_at) < thirty_days_ago,
-                    )
-                )
-            )
-        ).scalar()
-
-        source_stats_query = await db.execute(
-            select(
-                SourceOption.label,
-                func.count().label("total_items"),
-                func.count().filter(Listing.is_active.is_(True)).label("active_items"),
-                func.count().filter(Listing.is_active.is_(False)).label("inactive_items"),
-            )
-            .join(SourceOption, Listing.source_option_id == SourceOption.id)
-            .group_by(SourceOption.label)
+# (expires_at, cache_key, body, etag)
+_stats_cache: Optional[tuple[float, str, str, str]] = None
+_stats_lock = asyncio.Lock()
+
+
+def _etag(body: str) -> str:
+    return f'W/"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+
+
+def _cached_stats(cache_key: str) -> Optional[tuple[str, str]]:
+    if _stats_cache and _stats_cache[1] == cache_key and monotonic() < _stats_cache[0]:
+        return _stats_cache[2], _stats_cache[3]
+    return None
+
+
+@router.get("/stats", response_model=StatsResponse)
+async def read_stats(request: Request, db: AsyncSession = Depends(get_db)) -> StatsResponse:
+    """Return aggregated dashboard statistics.
+
+    The serialized response is cached for STATS_CACHE_TTL seconds in process
+    memory and in Redis (when available), under a key that includes the UTC
+    date so the day windows roll over at midnight. Concurrent misses in a
+    worker wait for a single computation.
+
+    Responses carry an ETag and a private Cache-Control max-age, so clients
+    can skip polls within the TTL and get a bodiless 304 when nothing
+    changed.
+    """
+    global _stats_cache
+    today = datetime.utcnow().date()
+    cache_key = f"{STATS_CACHE_PREFIX}:{today.isoformat()}"
+    cached = _cached_stats(cache_key)
+    if cached is None:
+        async with _stats_lock:
+            cached = _cached_stats(cache_key)
+            if cached is None:
+                body = await _load_stats_body(db, today, cache_key)
+                etag = _etag(body)
+                cached = (body, etag)
+                _stats_cache = (monotonic() + STATS_CACHE_TTL, cache_key, body, etag)
+    body, etag = cached
+
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={STATS_CACHE_TTL}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.post("/stats/cache/clear")
+async def clear_stats_cache():
+    """Drop cached /api/stats responses.
+
+    Clears this worker's in-process copy and the shared Redis entries; other
+    workers' in-process copies expire within STATS_CACHE_TTL seconds.
+    """
+    global _stats_cache
+    _stats_cache = None
+    redis = get_redis()
+    if redis:
+        keys = [key async for key in redis.scan_iter(match=f"{STATS_CACHE_PREFIX}:*")]
+        if keys:
+            await redis.delete(*keys)
+    return {"message": "Cleared stats cache."}
+
+
+async def _load_stats_body(db: AsyncSession, today: date, cache_key: str) -> str:
+    """Serialized stats from Redis, or computed and written back to Redis."""
+    redis = get_redis()
+    if redis:
+        try:
+            cached = await redis.get(cache_key)
+        except Exception as exc:  # Redis is optional; fall back to the database
+            logger.warning(f"Failed to read cached stats: {exc}")
+            cached, redis = None, None
+        if cached:
+            return cached
+
+    body = (await _compute_stats(db, today)).model_dump_json()
+    if redis:
+        try:
+            await redis.set(cache_key, body, ex=STATS_CACHE_TTL)
+        except Exception as exc:
+            logger.warning(f"Failed to cache stats: {exc}")
+    return body
+
+
+async def refresh_stats_snapshot() -> None:
+    """Compute the stats and publish them to the caches read_stats serves from."""
+    global _stats_cache
+    redis = get_redis()
+    # One worker per interval computes; the others pick the snapshot up from
+    # Redis. The lock expires well before the next refresh is due.
+    if redis:
+        try:
+            locked = await redis.set(
+                STATS_REFRESH_LOCK_KEY, "1", nx=True, ex=STATS_CACHE_TTL // 2
+            )
+        except RedisError as exc:  # no shared lock; compute and publish locally
+            logger.warning(f"Failed to take the stats refresh lock: {exc}")
+            locked, redis = True, None
+        if not locked:
+            return
+
+    today = datetime.utcnow().date()
+    cache_key = f"{STATS_CACHE_PREFIX}:{today.isoformat()}"
+    async with Session() as db:
+        body = (await _compute_stats(db, today)).model_dump_json()
+    _stats_cache = (monotonic() + STATS_CACHE_TTL, cache_key, body, _etag(body))
+    if redis:
+        try:
+            await redis.set(cache_key, body, ex=STATS_SNAPSHOT_TTL)
+        except RedisError as exc:
+            logger.warning(f"Failed to publish the stats snapshot: {exc}")
+
+
+_snapshot_worker: Optional[asyncio.Task[None]] = None
+
+
+def start_stats_snapshot_worker() -> None:
+    """Start refreshing the stats snapshot every STATS_CACHE_TTL seconds."""
+    global _snapshot_worker
+    if _snapshot_worker is None or _snapshot_worker.done():
+        _snapshot_worker = asyncio.create_task(_run_snapshot_worker(), name="stats-snapshot")
+
+
+async def stop_stats_snapshot_worker() -> None:
+    """Cancel the snapshot worker (called on application shutdown)."""
+    global _snapshot_worker
+    task = _snapshot_worker
+    _snapshot_worker = None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _run_snapshot_worker() -> None:
+    while True:
+        try:
+            await refresh_stats_snapshot()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error(f"Failed to refresh stats snapshot: {exc}", exc_info=True)
+        await asyncio.sleep(STATS_CACHE_TTL)
+
+
+async def _compute_stats(db: AsyncSession, today: date) -> StatsResponse:
+    # The statements are independent; run them on separate pooled sessions
+    # so their round trips overlap instead of queueing on one connection.
+    try:
+        (
+            listing_stats_result,
+            active_configs_result,
+            (price_increase_count, price_decrease_count, price_unchanged_count),
+            source_stats_result,
+        ) = await asyncio.gather(
+            db.execute(_LISTING_STATS_STMT, _stats_window_params(today)),
+            _execute_isolated(_ACTIVE_CONFIGS_STMT),
+            _load_price_change_counts(),
+            _execute_isolated(_SOURCE_STATS_STMT),
         )
-        source_stats_results = source_stats_query.all()
-
-        source_stats_dict = {
-            row.label: {
-                "total_items": row.total_items,
-                "active_items": row.active_items,
-                "inactive_items": row.inactive_items,
-            }
-            for row in source_stats_results
-            if row.label is not None
+    except SQLAlchemyError as exc:
+        logger.exception("Failed to compute stats")
+        raise HTTPException(status_code=503, detail="Stats unavailable") from exc
+
+    listing_stats = listing_stats_result.one()
+    source_stats_dict = {
+        row.label: {
+            "total_items": row.total_items,
+            "active_items": row.active_items,
+            "inactive_items": row.inactive_items,
         }
-    except Exception as exc:  # pragma: no cover - defensive
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+        for row in source_stats_result.all()
+        if row.label is not None
+    }
 
     return StatsResponse(
-        total_listings=total_listings or 0,
-        active_listings=active_listings or 0,
-        total_scraped_today=total_scraped_today or 0,
-        total_scraped_previous_day=total_scraped_previous_day or 0,
-        total_scraped_day_before_previous=total_scraped_day_before_previous or 0,
-        total_scraped_last_7_days=total_scraped_last_7_days or 0,
-        total_scraped_last_30_days=total_scraped_last_30_days or 0,
-        active_listings_last_7_days=active_listings_last_7_days or 0,
-        active_listings_last_30_days=active_listings_last_30_days or 0,
-        inactive_listings_today=inactive_listings_today or 0,
-        inactive_listings_last_7_days=inactive_listings_last_7_days or 0,
-        inactive_listings_last_30_days=inactive_listings_last_30_days or 0,
-        active_listings_day_before_previous=active_listings_day_before_previous or 0,
-        total_scraped_last_7_days_day_before_previous=total_scraped_last_7_days_day_before_previous or 0,
-        total_scraped_last_30_days_day_before_previous=total_scraped_last_30_days_day_before_previous or 0,
-        active_listings_last_7_days_day_before_previous=active_listings_last_7_days_day_before_previous or 0,
-        active_listings_last_30_days_day_before_previous=active_listings_last_30_days_day_before_previous or 0,
-        inactive_listings_day_before_previous=inactive_listings_day_before_previous or 0,
-        inactive_listings_last_7_days_day_before_previous=inactive_listings_last_7_days_day_before_previous or 0,
-        inactive_listings_last_30_days_day_before_previous=inactive_listings_last_30_days_day_before_previous or 0,
-        active_configs=active_configs or 0,
-        avg_price_cents=float(avg_price_cents) if avg_price_cents else None,
-        min_price_cents=min_price_cents or None,
-        max_price_cents=max_price_cents or None,
-        price_increase_count=price_increase_count or 0,
-        price_decrease_count=price_decrease_count or 0,
-        price_unchanged_count=price_unchanged_count or 0,
-        total_listings_previous_day=total_listings_previous_day or 0,
-        total_listings_previous_7_days=total_listings_previous_7_days or 0,
-                total_listings_previous_30_days=total_listings_previous_30_days or 0,
-                total_listings_day_before_previous=total_listings_day_before_previous or 0,
-                total_scraped_previous_7_days=total_scraped_previous_7_days or 0,
-                total_scraped_previous_30_days=total_scraped_previous_30_days or 0,
-                source_stats=source_stats_dict,
+        **listing_stats._mapping,
+        # The "listings previous" trend fields report the same windows.
+        total_listings_previous_day=listing_stats.total_scraped_previous_day,
+        total_listings_previous_7_days=listing_stats.total_scraped_previous_7_days,
+        total_listings_previous_30_days=listing_stats.total_scraped_previous_30_days,
+        active_configs=active_configs_result.scalar_one(),
+        price_increase_count=price_increase_count,
+        price_decrease_count=price_decrease_count,
+        price_unchanged_count=price_unchanged_count,
+        source_stats=source_stats_dict,
     )
 
 
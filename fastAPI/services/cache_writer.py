@@ -0,0 +1,86 @@
+"""Batched, fire-and-forget Redis cache writes for the FastAPI service."""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Optional, Union
+
+from app.utils.logging import get_logger
+from fastAPI.redis import get_redis
+
+logger = get_logger(__name__)
+
+# A batch is flushed once it holds this many writes or this many seconds
+# have passed since its first write, whichever comes first.
+CACHE_WRITE_BATCH_SIZE = int(os.getenv("CACHE_WRITE_BATCH_SIZE", "64"))
+CACHE_WRITE_FLUSH_SECONDS = float(os.getenv("CACHE_WRITE_FLUSH_SECONDS", "0.02"))
+
+_write_queue: asyncio.Queue[tuple[str, Union[str, bytes], int]] = asyncio.Queue()
+_write_worker: Optional[asyncio.Task[None]] = None
+
+
+def enqueue_cache_write(key: str, value: Union[str, bytes], ttl: int) -> None:
+    """Queue ``SET key value EX ttl`` without waiting for Redis."""
+    _write_queue.put_nowait((key, value, ttl))
+    start_cache_writer()
+
+
+def start_cache_writer() -> None:
+    """Start the write worker on the running loop if it is not already running."""
+    global _write_worker
+    if _write_worker is None or _write_worker.done():
+        _write_worker = asyncio.create_task(_run_cache_writer(), name="cache-writer")
+
+
+async def stop_cache_writer() -> None:
+    """Flush pending writes and stop the worker (called on application shutdown)."""
+    global _write_worker
+    task = _write_worker
+    _write_worker = None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    if not _write_queue.empty():
+        await _flush(_drain_nowait([]))
+
+
+def _drain_nowait(batch: list) -> list:
+    while len(batch) < CACHE_WRITE_BATCH_SIZE:
+        try:
+            batch.append(_write_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
+
+async def _run_cache_writer() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _write_queue.get()]
+        deadline = loop.time() + CACHE_WRITE_FLUSH_SECONDS
+        while len(batch) < CACHE_WRITE_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_write_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        await _flush(batch)
+
+
+async def _flush(batch: list[tuple[str, Union[str, bytes], int]]) -> None:
+    redis = get_redis()
+    if not redis or not batch:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key, value, ttl in batch:
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning(f"Failed to write {len(batch)} cache entries: {exc}")
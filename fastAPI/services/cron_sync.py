@@ -0,0 +1,57 @@
+"""Coalesced crontab synchronization for the FastAPI service."""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Optional
+
+from app.scheduler import sync_crontab
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Requests arriving within this window are folded into a single sync.
+SYNC_DEBOUNCE_SECONDS = float(os.getenv("SCRAPER_CRON_SYNC_DEBOUNCE", "0.2"))
+
+_sync_requested = asyncio.Event()
+_sync_worker: Optional[asyncio.Task[None]] = None
+
+
+def request_crontab_sync() -> None:
+    """Ask the background worker to rewrite the crontab soon."""
+    _sync_requested.set()
+    start_crontab_sync_worker()
+
+
+def start_crontab_sync_worker() -> None:
+    """Start the sync worker on the running loop if it is not already running."""
+    global _sync_worker
+    if _sync_worker is None or _sync_worker.done():
+        _sync_worker = asyncio.create_task(_run_sync_worker(), name="crontab-sync")
+
+
+async def stop_crontab_sync_worker() -> None:
+    """Cancel the sync worker (called on application shutdown)."""
+    global _sync_worker
+    task = _sync_worker
+    _sync_worker = None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _run_sync_worker() -> None:
+    while True:
+        await _sync_requested.wait()
+        await asyncio.sleep(SYNC_DEBOUNCE_SECONDS)
+        # Clear after the debounce window so bursts collapse into one sync;
+        # requests made while syncing set the event again and trigger another pass.
+        _sync_requested.clear()
+        try:
+            await sync_crontab()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error(f"Failed to sync cron: {exc}", exc_info=True)
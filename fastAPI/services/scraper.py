@@ -5,12 +5,12 @@ from typing import Any, Dict, Optional
 import sys
 from pathlib import Path
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 
 from app.db.models import Listing, ScrapeConfig
 from app.db.session import Session, init_db
 from app.scheduler import build_scrape_command #, load_listings_to_cache_async
-from fastAPI.redis import set_config_status
+from fastAPI.redis import invalidate_configs_cache, set_config_status
 from app.utils.logging import get_logger
 
 
@@ -25,6 +25,13 @@ logger = get_logger(__name__)
 PROJECT_ROOT = Path(os.getenv("SCRAPER_WORKDIR", Path(__file__).resolve().parents[2])) # Adjust PROJECT_ROOT for this file
 LOG_FILE = PROJECT_ROOT / "logs" / "cron.log"
 
+FINAL_RUN_STATUSES = frozenset({"success", "failed"})
+
+def is_run_active(config_id: int) -> bool:
+    """Return True when a manual run for the configuration is in flight."""
+    return config_id in _active_runs
+
+
 async def schedule_manual_run(config: ScrapeConfig) -> None:
     """
     Launch a manual scrape run for the supplied configuration.
@@ -191,16 +198,24 @@ async def _update_status(
 
     await set_config_status(config_id, status, message=message, extra=extra)
 
-    async with Session() as session:
-        config = await session.get(ScrapeConfig, config_id)
-        if not config:
-            return
+    # Redis carries the transient queued/running states; only the final
+    # outcome is written back to the configuration row.
+    if status not in FINAL_RUN_STATUSES:
+        return
 
-        config.last_run_status = status
-        config.last_run_at = datetime.now(tz=timezone.utc)
-        if items is not None:
-            config.last_run_items = items
-        elif status in {"queued", "running"}:
-            config.last_run_items = None
+    values = {
+        "last_run_status": status,
+        "last_run_at": datetime.now(tz=timezone.utc),
+    }
+    # Keep the previous run's count when this outcome carries none.
+    if items is not None:
+        values["last_run_items"] = items
 
+    async with Session() as session:
+        await session.execute(
+            update(ScrapeConfig)
+            .where(ScrapeConfig.id == config_id)
+            .values(**values)
+        )
         await session.commit()
+    await invalidate_configs_cache()
@@ -0,0 +1,14 @@
+-- Migration: Add composite index for keyset pagination of listings
+-- Date: 2026-10-16
+-- Description: Backs cursor pagination on /api/listings, which seeks on
+--              (last_seen_at, id) instead of using large OFFSETs
+
+-- PostgreSQL migration
+CREATE INDEX IF NOT EXISTS ix_listings_last_seen_at_id
+    ON vinted.listings (last_seen_at, id);
+
+-- SQLite migration (for development)
+-- CREATE INDEX IF NOT EXISTS ix_listings_last_seen_at_id ON listings(last_seen_at, id);
+
+-- Rollback (if needed):
+-- DROP INDEX IF EXISTS vinted.ix_listings_last_seen_at_id;
@@ -0,0 +1,18 @@
+-- Migration: Add trigram index on listing titles
+-- Date: 2026-10-16
+-- Description: The listings search filter is Listing.title ILIKE '%term%',
+--              which a B-tree index cannot serve. A pg_trgm GIN index lets
+--              PostgreSQL answer substring ILIKE queries from the index
+--              instead of scanning the whole table.
+
+-- PostgreSQL migration
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_listings_title_trgm
+    ON vinted.listings USING gin (title gin_trgm_ops);
+
+-- SQLite migration (for development)
+-- Not applicable: SQLite has no trigram indexes; ILIKE falls back to a scan.
+
+-- Rollback (if needed):
+-- DROP INDEX IF EXISTS vinted.ix_listings_title_trgm;
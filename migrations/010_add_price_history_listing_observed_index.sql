@@ -0,0 +1,22 @@
+-- Migration: Add covering index for recent price lookups
+-- Date: 2026-10-16
+-- Description: The listings page reads the latest two prices per listing
+--              (ORDER BY observed_at DESC LIMIT 1 OFFSET n). Indexing
+--              (listing_id, observed_at) and including price_cents lets
+--              PostgreSQL answer these from an index-only scan (read
+--              backwards for DESC) without visiting the heap.
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block; run this
+-- file with plain psql (no --single-transaction).
+-- Verify with EXPLAIN on a listings page: expect "Index Only Scan using
+-- ix_price_history_listing_observed".
+
+-- PostgreSQL migration
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_price_history_listing_observed
+    ON vinted.price_history (listing_id, observed_at) INCLUDE (price_cents);
+
+-- SQLite migration (for development)
+-- CREATE INDEX IF NOT EXISTS ix_price_history_listing_observed ON price_history(listing_id, observed_at);
+
+-- Rollback (if needed):
+-- DROP INDEX CONCURRENTLY IF EXISTS vinted.ix_price_history_listing_observed;
@@ -0,0 +1,30 @@
+-- Migration: Add sort indexes for paginated listings
+-- Date: 2026-10-16
+-- Description: /api/listings orders by "<column> DESC NULLS LAST, id DESC"
+--              (or the mirrored ASC NULLS FIRST, id ASC). Indexes in that
+--              exact order let PostgreSQL walk the index (forwards or
+--              backwards) and stop after OFFSET + LIMIT rows instead of
+--              sorting every matching listing.
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block; run this
+-- file with plain psql (no --single-transaction).
+
+-- PostgreSQL migration
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_listings_sort_last_seen_at
+    ON vinted.listings (last_seen_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_listings_sort_first_seen_at
+    ON vinted.listings (first_seen_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_listings_sort_price
+    ON vinted.listings (price_cents DESC NULLS LAST, id DESC);
+
+-- SQLite migration (for development)
+-- CREATE INDEX IF NOT EXISTS ix_listings_sort_last_seen_at ON listings(last_seen_at DESC, id DESC);
+-- CREATE INDEX IF NOT EXISTS ix_listings_sort_first_seen_at ON listings(first_seen_at DESC, id DESC);
+-- CREATE INDEX IF NOT EXISTS ix_listings_sort_price ON listings(price_cents DESC, id DESC);
+
+-- Rollback (if needed):
+-- DROP INDEX CONCURRENTLY IF EXISTS vinted.ix_listings_sort_last_seen_at;
+-- DROP INDEX CONCURRENTLY IF EXISTS vinted.ix_listings_sort_first_seen_at;
+-- DROP INDEX CONCURRENTLY IF EXISTS vinted.ix_listings_sort_price;
@@ -0,0 +1,35 @@
+-- Migration: Store listings.platform_ids as JSONB with a GIN index
+-- Date: 2026-10-16
+-- Description: The platform filter on /api/listings uses the JSONB
+--              containment operator (platform_ids @> '[<id>]'). With a json
+--              column every request had to cast and scan; as jsonb with a
+--              jsonb_path_ops GIN index the lookup is index-backed.
+
+-- PostgreSQL migration
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'vinted'
+        AND table_name = 'listings'
+        AND column_name = 'platform_ids'
+        AND data_type = 'json'
+    ) THEN
+        ALTER TABLE vinted.listings
+        ALTER COLUMN platform_ids TYPE jsonb USING platform_ids::jsonb;
+
+        RAISE NOTICE 'Converted vinted.listings.platform_ids to jsonb';
+    ELSE
+        RAISE NOTICE 'Column platform_ids is not json, skipping conversion';
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS ix_listings_platform_ids_gin
+    ON vinted.listings USING gin (platform_ids jsonb_path_ops);
+
+-- SQLite migration (for development)
+-- Not applicable: SQLite stores JSON as text and has no GIN indexes.
+
+-- Rollback (if needed):
+-- DROP INDEX IF EXISTS vinted.ix_listings_platform_ids_gin;
+-- ALTER TABLE vinted.listings ALTER COLUMN platform_ids TYPE json USING platform_ids::json;
@@ -0,0 +1,24 @@
+-- Migration: Add listing_currencies materialized view
+-- Date: 2026-10-16
+-- Description: /api/listings returns the distinct currencies for the current
+--              filter set. Without filters this was a DISTINCT over the whole
+--              listings table on every cache miss; the view keeps the small
+--              (currency, is_active) set precomputed. The scraper refreshes it
+--              after each run (app.ingest.refresh_materialized_views).
+
+-- PostgreSQL migration
+CREATE MATERIALIZED VIEW IF NOT EXISTS vinted.listing_currencies AS
+SELECT DISTINCT currency, is_active
+FROM vinted.listings
+WHERE currency IS NOT NULL;
+
+-- REFRESH ... CONCURRENTLY requires a unique index on the view.
+CREATE UNIQUE INDEX IF NOT EXISTS ux_listing_currencies_currency_active
+    ON vinted.listing_currencies (currency, is_active);
+
+-- SQLite migration (for development)
+-- Not applicable: SQLite has no materialized views; the API falls back to
+-- SELECT DISTINCT on the listings table.
+
+-- Rollback (if needed):
+-- DROP MATERIALIZED VIEW IF EXISTS vinted.listing_currencies;
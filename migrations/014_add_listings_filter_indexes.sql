@@ -0,0 +1,31 @@
+-- Migration: Add filter indexes for /api/listings
+-- Date: 2026-10-16
+-- Description: The FastAPI listings endpoint now filters, sorts and pages in
+--              SQL instead of in Python. The default request filters on
+--              is_active and orders by last_seen_at, id; the taxonomy
+--              filters match on condition_option_id and source_option_id.
+--              category_id, price_cents and the platform_ids GIN index are
+--              covered by earlier migrations.
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block; run this
+-- file with plain psql (no --single-transaction).
+
+-- PostgreSQL migration
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_listings_active_last_seen_at_id
+    ON vinted.listings (is_active, last_seen_at DESC NULLS LAST, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_listings_condition_option_id
+    ON vinted.listings (condition_option_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_listings_source_option_id
+    ON vinted.listings (source_option_id);
+
+-- SQLite migration (for development)
+-- CREATE INDEX IF NOT EXISTS ix_listings_active_last_seen_at_id ON listings(is_active, last_seen_at DESC, id DESC);
+-- CREATE INDEX IF NOT EXISTS ix_listings_condition_option_id ON listings(condition_option_id);
+-- CREATE INDEX IF NOT EXISTS ix_listings_source_option_id ON listings(source_option_id);
+
+-- Rollback (if needed):
+-- DROP INDEX CONCURRENTLY IF EXISTS vinted.ix_listings_active_last_seen_at_id;
+-- DROP INDEX CONCURRENTLY IF EXISTS vinted.ix_listings_condition_option_id;
+-- DROP INDEX CONCURRENTLY IF EXISTS vinted.ix_listings_source_option_id;
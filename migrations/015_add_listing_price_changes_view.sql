@@ -0,0 +1,30 @@
+-- Migration: Add listing_price_changes materialized view
+-- Date: 2026-10-16
+-- Description: /api/stats counts listings whose latest price went up, down
+--              or stayed the same compared with the previous observation.
+--              That ranked every price_history row with ROW_NUMBER() on each
+--              request; the view keeps one (current, previous) price pair per
+--              listing with at least two priced observations. The scraper
+--              refreshes it after each run (app.ingest.refresh_materialized_views).
+
+-- PostgreSQL migration
+CREATE MATERIALIZED VIEW IF NOT EXISTS vinted.listing_price_changes AS
+SELECT
+    listing_id,
+    (array_agg(price_cents ORDER BY observed_at DESC))[1] AS current_price,
+    (array_agg(price_cents ORDER BY observed_at DESC))[2] AS previous_price
+FROM vinted.price_history
+WHERE price_cents IS NOT NULL
+GROUP BY listing_id
+HAVING count(*) > 1;
+
+-- REFRESH ... CONCURRENTLY requires a unique index on the view.
+CREATE UNIQUE INDEX IF NOT EXISTS ux_listing_price_changes_listing_id
+    ON vinted.listing_price_changes (listing_id);
+
+-- SQLite migration (for development)
+-- Not applicable: SQLite has no materialized views; the API falls back to
+-- ranking price_history rows per request.
+
+-- Rollback (if needed):
+-- DROP MATERIALIZED VIEW IF EXISTS vinted.listing_price_changes;
@@ -0,0 +1,43 @@
+-- Migration: Rebuild listing_price_changes from a per-listing LIMIT 2 lookup
+-- Date: 2026-10-16
+-- Description: listing_price_changes (migration 015) aggregated every
+--              price_history row with array_agg(... ORDER BY observed_at), a
+--              full sort of the table on each refresh. Reading the two most
+--              recent prices per listing through a LATERAL ... LIMIT 2 lets
+--              PostgreSQL walk ix_price_history_listing_observed (migration
+--              010) backwards with an index-only scan instead.
+--              The view keeps the same columns, so the API is unchanged.
+--
+-- Verify with EXPLAIN on the view's SELECT: expect "Index Only Scan Backward
+-- using ix_price_history_listing_observed" inside the lateral subquery.
+
+-- PostgreSQL migration
+DROP MATERIALIZED VIEW IF EXISTS vinted.listing_price_changes;
+
+CREATE MATERIALIZED VIEW vinted.listing_price_changes AS
+SELECT
+    l.id AS listing_id,
+    recent.prices[1] AS current_price,
+    recent.prices[2] AS previous_price
+FROM vinted.listings l
+CROSS JOIN LATERAL (
+    SELECT ARRAY(
+        SELECT ph.price_cents
+        FROM vinted.price_history ph
+        WHERE ph.listing_id = l.id
+          AND ph.price_cents IS NOT NULL
+        ORDER BY ph.observed_at DESC
+        LIMIT 2
+    ) AS prices
+) recent
+WHERE cardinality(recent.prices) = 2;
+
+-- REFRESH ... CONCURRENTLY requires a unique index on the view.
+CREATE UNIQUE INDEX IF NOT EXISTS ux_listing_price_changes_listing_id
+    ON vinted.listing_price_changes (listing_id);
+
+-- SQLite migration (for development)
+-- Not applicable: SQLite has no materialized views.
+
+-- Rollback (if needed): re-run 015_add_listing_price_changes_view.sql after
+-- DROP MATERIALIZED VIEW IF EXISTS vinted.listing_price_changes;
@@ -0,0 +1,64 @@
+"""SQL filters behind /api/listings, checked against an in-memory SQLite database."""
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("fastapi")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.models import Base, Listing
+from fastAPI.routers import listings as listings_router
+
+pytestmark = pytest.mark.skipif(
+    settings.database_url.startswith("postgresql"),
+    reason="the SQLite filter path needs a non-PostgreSQL DATABASE_URL",
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            Listing(id=1, url="https://example.test/1", platform_ids=[1, 3]),
+            Listing(id=2, url="https://example.test/2", platform_ids=[3]),
+            Listing(id=3, url="https://example.test/3", platform_ids=[11]),
+            Listing(id=4, url="https://example.test/4", platform_ids=[]),
+        ])
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _filters(**overrides):
+    params = dict(
+        search=None,
+        active_only=False,
+        currency=None,
+        price_min=None,
+        price_max=None,
+        condition_id=None,
+        condition=None,
+        category_id=None,
+        platform_id=None,
+        source_id=None,
+        source=None,
+        is_sold=None,
+    )
+    params.update(overrides)
+    return listings_router._listing_filters(**params)
+
+
+@pytest.mark.parametrize(
+    ("platform_id", "expected_ids"),
+    [(1, [1]), (3, [1, 2]), (11, [3]), (7, [])],
+)
+def test_platform_filter_matches_list_members(session, platform_id, expected_ids):
+    ids = session.execute(
+        select(Listing.id).where(*_filters(platform_id=platform_id)).order_by(Listing.id)
+    ).scalars().all()
+    assert ids == expected_ids